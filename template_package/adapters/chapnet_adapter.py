@@ -15,11 +15,15 @@ from pathlib import Path
 from biocypher._logger import logger
 
 
+def _pair(a, b):
+    """Canonical (order-independent) key for an undirected protein pair."""
+    return (a, b) if a <= b else (b, a)
+
+
 class ChapNetAdapter:
     def __init__(self, data_dir="template_package/data/chapnet"):
         self.data_dir = Path(data_dir)
-        self.interactions = []
-        self.genes = set()
+        self.sources = []  # (path, kind) pairs, parsed lazily in get_edges
         self._load_data()
 
     def _sanitize(self, text):
@@ -31,90 +35,72 @@ class ChapNetAdapter:
         return text.strip()
 
     def _load_data(self):
-        """Load ChapNet correlation data."""
+        """Locate ChapNet correlation data; rows are streamed in get_edges."""
         # Try JSON files first (Cytoscape format)
-        json_files = sorted(self.data_dir.glob('*.json'))
-        if json_files:
-            self._load_json_networks(json_files)
+        for jf in sorted(self.data_dir.glob('*.json')):
+            self.sources.append((jf, 'json'))
 
         # Also load CSV correlation data
         corr_path = self.data_dir / 'ChaperoneCorrelation.csv'
         if corr_path.exists():
-            self._load_correlation_csv(corr_path)
-
-    def _load_json_networks(self, json_files):
-        """Load Cytoscape JSON network files."""
-        for jf in json_files:
-            try:
-                with open(jf, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-
-                elements = data.get('elements', {})
-                edges = elements.get('edges', [])
-                nodes = elements.get('nodes', [])
-
-                # Track gene Ensembl IDs from nodes
-                for node in nodes:
-                    nd = node.get('data', {})
-                    ensembl = nd.get('Ensembl', '')
-                    if ensembl:
-                        self.genes.add(ensembl)
-
-                network_name = jf.stem
-
-                for edge in edges:
-                    ed = edge.get('data', {})
-                    source = ed.get('source', '')
-                    target = ed.get('target', '')
-                    source_sym = ed.get('sourceSymbol', ed.get('Protein1Symbol', '')).strip()
-                    target_sym = ed.get('targetSymbol', ed.get('Protein2Symbol', '')).strip()
-
-                    if not source or not target:
-                        continue
+            self.sources.append((corr_path, 'csv'))
+
+        logger.info(f"ChapNet: Found {len(self.sources)} network files")
+
+    def _iter_json_network(self, jf):
+        """Yield interactions from one Cytoscape JSON network file."""
+        try:
+            with open(jf, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+
+            elements = data.get('elements', {})
+            edges = elements.get('edges', [])
+
+            network_name = jf.stem
 
-                    self.interactions.append({
-                        'source': source,
-                        'target': target,
-                        'source_symbol': source_sym,
-                        'target_symbol': target_sym,
-                        'network': network_name,
-                    })
+            for edge in edges:
+                ed = edge.get('data', {})
+                source = ed.get('source', '')
+                target = ed.get('target', '')
+                source_sym = ed.get('sourceSymbol', ed.get('Protein1Symbol', '')).strip()
+                target_sym = ed.get('targetSymbol', ed.get('Protein2Symbol', '')).strip()
 
-                logger.info(f"ChapNet: Loaded {len(edges)} edges from {jf.name}")
-            except Exception as e:
-                logger.warning(f"ChapNet: Error loading {jf.name}: {e}")
+                if not source or not target:
+                    continue
 
-    def _load_correlation_csv(self, path):
-        """Load bulk correlation CSV (tissue-specific correlations)."""
+                yield source, target, source_sym, target_sym, network_name
+
+            logger.info(f"ChapNet: Loaded {len(edges)} edges from {jf.name}")
+        except Exception as e:
+            logger.warning(f"ChapNet: Error loading {jf.name}: {e}")
+
+    def _iter_correlation_csv(self, path):
+        """Yield interactions from the bulk correlation CSV (tissue-specific correlations)."""
         try:
             count = 0
-            seen = set()
-            with open(path, 'r', encoding='utf-8') as f:
-                reader = csv.DictReader(f)
-                for row in reader:
-                    p1 = row.get('Protein1', '').strip()
-                    p2 = row.get('Protein2', '').strip()
-                    p1_sym = row.get('Protein1Symbol', '').strip()
-                    p2_sym = row.get('Protein2Symbol', '').strip()
+            with open(path, 'r', encoding='utf-8', newline='') as f:
+                reader = csv.reader(f)
+                header = next(reader, [])
+                # Resolve column positions once instead of building a dict per row
+                col = {name.strip(): i for i, name in enumerate(header)}
+                i_p1 = col['Protein1']
+                i_p2 = col['Protein2']
+                i_s1 = col['Protein1Symbol']
+                i_s2 = col['Protein2Symbol']
+                min_len = max(i_p1, i_p2, i_s1, i_s2) + 1
 
+                for row in reader:
+                    if len(row) < min_len:
+                        continue
+                    p1 = row[i_p1].strip()
+                    p2 = row[i_p2].strip()
                     if not p1 or not p2:
                         continue
 
-                    pair = tuple(sorted([p1, p2]))
-                    if pair in seen:
-                        continue
-                    seen.add(pair)
-
-                    self.interactions.append({
-                        'source': p1,
-                        'target': p2,
-                        'source_symbol': p1_sym,
-                        'target_symbol': p2_sym,
-                        'network': 'ChaperoneCorrelation',
-                    })
+                    yield p1, p2, row[i_s1].strip(), row[i_s2].strip(), 'ChaperoneCorrelation'
                     count += 1
 
-            logger.info(f"ChapNet: Loaded {count} unique pairs from correlation CSV")
+            logger.info(f"ChapNet: Read {count} pairs from correlation CSV")
         except Exception as e:
             logger.warning(f"ChapNet: Error loading correlation CSV: {e}")
 
@@ -125,29 +111,33 @@ class ChapNetAdapter:
 
     def get_edges(self):
         """
-        Generate chaperone interaction edges.
+        Generate chaperone interaction edges, parsing the source files on the fly.
         Yields: (id, source, target, label, properties)
         """
-        logger.info(f"ChapNet: Generating edges from {len(self.interactions)} interactions...")
+        logger.info(f"ChapNet: Generating edges from {len(self.sources)} network files...")
         count = 0
         seen = set()
 
-        for inter in self.interactions:
-            source = inter['source']
-            target = inter['target']
-            pair = tuple(sorted([source, target]))
-            if pair in seen:
-                continue
-            seen.add(pair)
-
-            props = {
-                'source_symbol': self._sanitize(inter['source_symbol']),
-                'target_symbol': self._sanitize(inter['target_symbol']),
-                'network': inter['network'],
-                'source_db': 'ChapNet',
-            }
-
-            yield (None, source, target, "ChaperoneInteraction", props)
-            count += 1
+        for path, kind in self.sources:
+            if kind == 'json':
+                rows = self._iter_json_network(path)
+            else:
+                rows = self._iter_correlation_csv(path)
+
+            for source, target, source_sym, target_sym, network in rows:
+                pair = _pair(source, target)
+                if pair in seen:
+                    continue
+                seen.add(pair)
+
+                props = {
+                    'source_symbol': self._sanitize(source_sym),
+                    'target_symbol': self._sanitize(target_sym),
+                    'network': network,
+                    'source_db': 'ChapNet',
+                }
+
+                yield (None, source, target, "ChaperoneInteraction", props)
+                count += 1
 
         logger.info(f"ChapNet: Generated {count} chaperone interaction edges")
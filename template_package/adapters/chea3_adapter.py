@@ -8,10 +8,42 @@ ChEA3 integrates TF-target gene sets from ChIP-seq/ChIP-chip experiments,
 co-expression data, and ENCODE/Consensus libraries.
 """
 
+import sys
 from pathlib import Path
 from biocypher._logger import logger
 
 
+def _parse_gmt(path, library):
+    """
+    Parse one GMT library into a list of (tf, target, library, experiment)
+    tuples. TF and target symbols are interned: a few thousand distinct genes
+    recur across millions of records, so each record only holds references.
+    """
+    logger.info(f"ChEA3: Loading {path.name}...")
+    records = []
+
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            parts = line.strip().split('\t')
+            if len(parts) < 3:
+                continue
+
+            # GMT format: TF_info \t description \t gene1 \t gene2 ...
+            tf_info = parts[0].strip()
+            targets = [g.strip() for g in parts[2:] if g.strip()]
+
+            # Extract TF name (first word before space or PMID)
+            tf_name = tf_info.split()[0] if tf_info else ''
+            if not tf_name:
+                continue
+            tf_name = sys.intern(tf_name)
+
+            for target in targets:
+                records.append((tf_name, sys.intern(target), library, tf_info))
+
+    return records
+
+
 class ChEA3Adapter:
     def __init__(self, data_dir="template_package/data/chea3"):
         self.data_dir = Path(data_dir)
@@ -33,42 +65,16 @@ class ChEA3Adapter:
             ('ChEA_2022.gmt', 'ChEA_ChIP'),
             ('ENCODE_ChEA_Consensus_TFs.gmt', 'ENCODE_Consensus'),
         ]
-
         total = 0
         for filename, library in gmt_files:
             path = self.data_dir / filename
             if not path.exists():
                 continue
 
-            logger.info(f"ChEA3: Loading {filename}...")
-            count = 0
-
-            with open(path, 'r', encoding='utf-8') as f:
-                for line in f:
-                    parts = line.strip().split('\t')
-                    if len(parts) < 3:
-                        continue
-
-                    # GMT format: TF_info \t description \t gene1 \t gene2 ...
-                    tf_info = parts[0].strip()
-                    targets = [g.strip() for g in parts[2:] if g.strip()]
-
-                    # Extract TF name (first word before space or PMID)
-                    tf_name = tf_info.split()[0] if tf_info else ''
-                    if not tf_name:
-                        continue
-
-                    for target in targets:
-                        self.tf_targets.append({
-                            'tf': tf_name,
-                            'target': target,
-                            'library': library,
-                            'experiment': tf_info,
-                        })
-                        count += 1
-
-            total += count
-            logger.info(f"ChEA3: Loaded {count} TF-target pairs from {filename}")
+            records = _parse_gmt(path, library)
+            self.tf_targets.extend(records)
+            total += len(records)
+            logger.info(f"ChEA3: Loaded {len(records)} TF-target pairs from {path.name}")
 
         logger.info(f"ChEA3: Total {total} TF-target relationships")
 
@@ -86,22 +92,22 @@ class ChEA3Adapter:
         seen = set()
         count = 0
 
-        for record in self.tf_targets:
-            key = (record['tf'], record['target'], record['library'])
+        for tf, target, library, experiment in self.tf_targets:
+            key = (tf, target, library)
             if key in seen:
                 continue
             seen.add(key)
 
             props = {
-                'library': record['library'],
-                'experiment': self._sanitize(record['experiment'][:200]),
+                'library': library,
+                'experiment': self._sanitize(experiment[:200]),
                 'source': 'ChEA3',
             }
 
             yield (
                 None,
-                record['tf'],
-                record['target'],
+                tf,
+                target,
                 "TFTargetInteraction",
                 props
             )
@@ -12,6 +12,36 @@ import json
 import pandas as pd
 from biocypher._logger import logger
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# ChEBI relation_type_id -> relation name; None (type 5, "is_a") marks SubclassOf
+_REL_NAMES = {
+    '1': 'is_conjugate_acid_of',
+    '2': 'is_conjugate_base_of',
+    '3': 'is_tautomer_of',
+    '4': 'is_enantiomer_of',
+    '5': None,
+    '6': 'has_part',
+    '7': 'has_role',
+    '8': 'has_parent_hydride',
+    '9': 'is_substituent_group_from',
+    '10': 'has_functional_parent',
+}
+
+
+def _dumps(obj):
+    """
+    Compact JSON string; uses orjson when available. The json fallback is
+    configured to match orjson byte for byte (no spaces, raw non-ASCII), so
+    stored xrefs do not depend on which serialiser is installed.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj).decode('utf-8')
+    return json.dumps(obj, separators=(',', ':'), ensure_ascii=False)
+
 
 class ChEBIAdapter:
     def __init__(self, data_dir="template_package/data/chebi"):
@@ -186,7 +216,7 @@ class ChEBIAdapter:
 
             # Collect cross-references as JSON string
             xrefs = self.xrefs_by_compound.get(internal_id, {})
-            xrefs_json = json.dumps(xrefs) if xrefs else ""
+            xrefs_json = _dumps(xrefs) if xrefs else ""
 
             props = {
                 'name': name,
@@ -214,11 +244,12 @@ class ChEBIAdapter:
         relation_count = 0
         skipped = 0
 
-        for _, row in self.relations.iterrows():
-            init_id = str(row.get('init_id', ''))
-            final_id = str(row.get('final_id', ''))
-            rel_type = str(row.get('relation_type_id', ''))
+        # Pull the columns out once; iterrows() would build a Series per row
+        init_ids = self.relations['init_id'].to_numpy(dtype=object)
+        final_ids = self.relations['final_id'].to_numpy(dtype=object)
+        rel_types = self.relations['relation_type_id'].to_numpy(dtype=object)
 
+        for init_id, final_id, rel_type in zip(init_ids, final_ids, rel_types):
             # Map internal IDs to ChEBI accessions
             source_chebi = self.id_to_chebi.get(init_id)
             target_chebi = self.id_to_chebi.get(final_id)
@@ -227,8 +258,8 @@ class ChEBIAdapter:
                 skipped += 1
                 continue
 
-            # Type 5 = "is_a" (subclass)
-            if rel_type == '5':
+            rel_name = _REL_NAMES.get(rel_type, f'relation_{rel_type}')
+            if rel_name is None:
                 yield (
                     None,
                     source_chebi,
@@ -238,20 +269,6 @@ class ChEBIAdapter:
                 )
                 subclass_count += 1
             else:
-                # Map relation type IDs to names
-                rel_names = {
-                    '1': 'is_conjugate_acid_of',
-                    '2': 'is_conjugate_base_of',
-                    '3': 'is_tautomer_of',
-                    '4': 'is_enantiomer_of',
-                    '6': 'has_part',
-                    '7': 'has_role',
-                    '8': 'has_parent_hydride',
-                    '9': 'is_substituent_group_from',
-                    '10': 'has_functional_parent',
-                }
-                rel_name = rel_names.get(rel_type, f'relation_{rel_type}')
-
                 yield (
                     None,
                     source_chebi,
@@ -8,6 +8,8 @@ circAtlas is a comprehensive database of circular RNAs across
 vertebrate species with tissue expression profiles.
 """
 
+import sys
+from array import array
 from pathlib import Path
 from biocypher._logger import logger
 
@@ -15,7 +17,14 @@ from biocypher._logger import logger
 class CircAtlasAdapter:
     def __init__(self, data_dir="template_package/data/circatlas"):
         self.data_dir = Path(data_dir)
-        self.circrnas = []
+        # Column-wise storage: one compact array/list per field instead of a
+        # dict per circRNA. Coordinates live in int64 arrays, and the few
+        # distinct chromosome/strand strings are interned.
+        self.circ_ids = []
+        self.chromosomes = []
+        self.starts = array('q')
+        self.ends = array('q')
+        self.strands = []
         self._load_data()
 
     def _sanitize(self, text):
@@ -39,11 +48,12 @@ class CircAtlasAdapter:
         with open(path, 'r', encoding='utf-8') as f:
             header = None
             for line in f:
-                parts = line.strip().split('\t')
                 if header is None:
-                    header = parts
+                    header = line.strip().split('\t')
                     continue
 
+                # Only the first five columns are used; leave the rest unsplit
+                parts = line.split('\t', 5)
                 if len(parts) < 5:
                     continue
 
@@ -62,13 +72,11 @@ class CircAtlasAdapter:
                 except ValueError:
                     continue
 
-                self.circrnas.append({
-                    'circ_id': circ_id,
-                    'chromosome': chrom,
-                    'start': start_int,
-                    'end': end_int,
-                    'strand': strand,
-                })
+                self.circ_ids.append(circ_id)
+                self.chromosomes.append(sys.intern(chrom))
+                self.starts.append(start_int)
+                self.ends.append(end_int)
+                self.strands.append(sys.intern(strand))
                 count += 1
 
                 if count >= 500000:
@@ -84,16 +92,18 @@ class CircAtlasAdapter:
         logger.info("circAtlas: Generating nodes...")
         count = 0
 
-        for circ in self.circrnas:
+        for circ_id, chrom, start, end, strand in zip(
+            self.circ_ids, self.chromosomes, self.starts, self.ends, self.strands
+        ):
             props = {
-                'chromosome': circ['chromosome'],
-                'start': circ['start'],
-                'end': circ['end'],
-                'strand': circ['strand'],
+                'chromosome': chrom,
+                'start': start,
+                'end': end,
+                'strand': strand,
                 'source': 'circAtlas_v3',
             }
 
-            yield (f"circAtlas:{circ['circ_id']}", "CircRNAAtlas", props)
+            yield (f"circAtlas:{circ_id}", "CircRNAAtlas", props)
             count += 1
 
         logger.info(f"circAtlas: Generated {count} CircRNAAtlas nodes")
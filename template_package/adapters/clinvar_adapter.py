@@ -8,15 +8,40 @@ ClinVar is a public archive of reports of the relationships
 among human variations and phenotypes, with supporting evidence.
 """
 
-import gzip
+import io
+import sys
+from array import array
 from pathlib import Path
 from biocypher._logger import logger
 
+# ISA-L's igzip is a drop-in, several times faster replacement for gzip
+try:
+    from isal import igzip as gzip
+except ImportError:
+    import gzip
+
+
+def _open_gz(path, errors='strict'):
+    """Open a gzipped text file for streaming reads through a 1 MiB buffer."""
+    raw = io.BufferedReader(gzip.open(path, 'rb'), buffer_size=1 << 20)
+    return io.TextIOWrapper(raw, encoding='utf-8', errors=errors)
+
 
 class ClinVarAdapter:
     def __init__(self, data_dir="template_package/data/clinvar"):
         self.data_dir = Path(data_dir)
-        self.variants = []
+        # Column-wise storage (one list per field) instead of a dict per variant
+        self.variants = {
+            'allele_id': [],
+            'type': [],
+            'name': [],
+            'gene_symbol': [],
+            'clinical_significance': [],
+            'chromosome': [],
+            'start': array('q'),
+            'phenotype': [],
+            'review_status': [],
+        }
         self._load_data()
 
     def _sanitize(self, text):
@@ -36,16 +61,27 @@ class ClinVarAdapter:
 
         logger.info("ClinVar: Loading variant summary (GRCh38 pathogenic/likely pathogenic)...")
         count = 0
-        seen = set()
+        last_key = None  # sort key of the previous accepted AlleleID
+        seen = None      # full AlleleID set, only built if the file is out of order
+        cols = self.variants
 
-        with gzip.open(path, 'rt', encoding='utf-8') as f:
+        with _open_gz(path) as f:
             header = None
             for line in f:
-                parts = line.strip().split('\t')
                 if header is None:
-                    header = parts
+                    header = line.strip().split('\t')
                     continue
 
+                # Most rows are GRCh37 or not pathogenic: reject them with a
+                # substring scan before paying for the split (exact column
+                # checks follow below)
+                if 'athogenic' not in line or 'GRCh38' not in line:
+                    continue
+
+                # Columns past ReviewStatus (index 24) are never used, so
+                # leave them as one unsplit remainder
+                parts = line.strip().split('\t', 25)
+
                 if len(parts) < 20:
                     continue
 
@@ -67,27 +103,40 @@ class ClinVarAdapter:
                 if 'athogenic' not in clin_sig:
                     continue
 
-                # Deduplicate
-                if allele_id in seen:
-                    continue
-                seen.add(allele_id)
+                # Deduplicate. variant_summary is sorted by AlleleID, so repeats
+                # are adjacent and comparing with the previous accepted ID is
+                # enough; if an ID ever goes backwards, fall back to a set.
+                if seen is None:
+                    key = (len(allele_id), allele_id)
+                    if last_key is not None and key <= last_key:
+                        if key == last_key:
+                            continue
+                        logger.info("ClinVar: AlleleIDs not sorted, deduplicating with a set")
+                        seen = set(cols['allele_id'])
+                    else:
+                        last_key = key
+                if seen is not None:
+                    if allele_id in seen:
+                        continue
+                    seen.add(allele_id)
 
                 try:
                     start_int = int(start)
                 except ValueError:
                     start_int = 0
 
-                self.variants.append({
-                    'allele_id': allele_id,
-                    'type': var_type,
-                    'name': name[:200],
-                    'gene_symbol': gene_symbol,
-                    'clinical_significance': clin_sig,
-                    'chromosome': chromosome,
-                    'start': start_int,
-                    'phenotype': phenotype_list[:200],
-                    'review_status': review_status,
-                })
+                # Low-cardinality fields (type, significance, chromosome,
+                # review status, gene) are interned so repeats share one object
+                cols['allele_id'].append(allele_id)
+                cols['type'].append(sys.intern(var_type))
+                # Text fields are stored already sanitized for CSV output
+                cols['name'].append(self._sanitize(name[:200]))
+                cols['gene_symbol'].append(sys.intern(self._sanitize(gene_symbol)))
+                cols['clinical_significance'].append(sys.intern(self._sanitize(clin_sig)))
+                cols['chromosome'].append(sys.intern(chromosome))
+                cols['start'].append(start_int)
+                cols['phenotype'].append(self._sanitize(phenotype_list[:200]))
+                cols['review_status'].append(sys.intern(self._sanitize(review_status)))
                 count += 1
 
                 if count >= 500000:
@@ -103,20 +152,27 @@ class ClinVarAdapter:
         logger.info("ClinVar: Generating nodes...")
         count = 0
 
-        for var in self.variants:
+        cols = self.variants
+        rows = zip(
+            cols['allele_id'], cols['type'], cols['name'], cols['gene_symbol'],
+            cols['clinical_significance'], cols['chromosome'], cols['start'],
+            cols['phenotype'], cols['review_status'],
+        )
+        for (allele_id, var_type, name, gene_symbol, clin_sig, chromosome,
+             start, phenotype, review_status) in rows:
             props = {
-                'type': var['type'],
-                'name': self._sanitize(var['name']),
-                'gene_symbol': self._sanitize(var['gene_symbol']),
-                'clinical_significance': self._sanitize(var['clinical_significance']),
-                'chromosome': var['chromosome'],
-                'start': var['start'],
-                'phenotype': self._sanitize(var['phenotype']),
-                'review_status': self._sanitize(var['review_status']),
+                'type': var_type,
+                'name': name,
+                'gene_symbol': gene_symbol,
+                'clinical_significance': clin_sig,
+                'chromosome': chromosome,
+                'start': start,
+                'phenotype': phenotype,
+                'review_status': review_status,
                 'source': 'ClinVar',
             }
 
-            yield (f"ClinVar:{var['allele_id']}", "ClinVarVariant", props)
+            yield (f"ClinVar:{allele_id}", "ClinVarVariant", props)
             count += 1
 
         logger.info(f"ClinVar: Generated {count} ClinVarVariant nodes")
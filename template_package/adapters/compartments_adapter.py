@@ -8,6 +8,7 @@ Loads subcellular localization data from Compartments database and generates:
 Uses knowledge-based and experimental evidence channels.
 """
 
+import sys
 from pathlib import Path
 from biocypher._logger import logger
 
@@ -18,7 +19,9 @@ class CompartmentsAdapter:
         self.data_dir = data_dir
         self.min_confidence = min_confidence
         self.compartments = {}  # GO_id -> name
-        self.localizations = []
+        # (gene_name, GO_id) -> (confidence, evidence_type, source) of the
+        # highest-confidence record
+        self.localizations = {}
         self.ensp_to_gene = {}  # ENSP -> gene_name
         self._load_data()
 
@@ -32,7 +35,6 @@ class CompartmentsAdapter:
 
     def _load_data(self):
         """Load Compartments knowledge and experimental data."""
-        seen_pairs = set()
 
         for filename, evidence_type in [
             ('human_compartment_knowledge_full.tsv', 'knowledge'),
@@ -46,7 +48,8 @@ class CompartmentsAdapter:
             logger.info(f"Compartments: Loading {filename}...")
             count = 0
 
-            with open(filepath, 'r', encoding='utf-8') as f:
+            # 1 MiB read buffer: far fewer read syscalls than the 8 KiB default
+            with open(filepath, 'r', encoding='utf-8', buffering=1 << 20) as f:
                 for line in f:
                     parts = line.strip().split('\t')
                     if len(parts) < 7:
@@ -76,19 +79,16 @@ class CompartmentsAdapter:
                         if go_id not in self.compartments:
                             self.compartments[go_id] = self._sanitize(go_name)
 
-                    # Deduplicate by gene+compartment (keep highest confidence)
+                    # Deduplicate by gene+compartment (keep highest confidence;
+                    # ties keep the first record seen)
                     pair_key = (gene_name, go_id)
-                    if pair_key in seen_pairs:
+                    prev = self.localizations.get(pair_key)
+                    if prev is not None and confidence <= prev[0]:
                         continue
-                    seen_pairs.add(pair_key)
-
-                    self.localizations.append({
-                        'gene_name': gene_name,
-                        'go_id': go_id,
-                        'confidence': confidence,
-                        'evidence_type': evidence_type,
-                        'source': source,
-                    })
+
+                    # The key already holds gene and GO ID; keep the rest as a
+                    # small tuple rather than a five-key dict per pair
+                    self.localizations[pair_key] = (confidence, evidence_type, sys.intern(source))
                     count += 1
 
             logger.info(f"Compartments: Loaded {count} records from {filename}")
@@ -124,17 +124,17 @@ class CompartmentsAdapter:
         logger.info("Compartments: Generating edges...")
         count = 0
 
-        for loc in self.localizations:
+        for (gene_name, go_id), (confidence, evidence_type, source) in self.localizations.items():
             props = {
-                'confidence': loc['confidence'],
-                'evidence_type': loc['evidence_type'],
-                'source_db': loc['source'],
+                'confidence': confidence,
+                'evidence_type': evidence_type,
+                'source_db': source,
             }
 
             yield (
                 None,
-                loc['gene_name'],  # Gene name (can be matched to Gene nodes)
-                loc['go_id'],
+                gene_name,  # Gene name (can be matched to Gene nodes)
+                go_id,
                 "ProteinLocatedIn",
                 props
             )
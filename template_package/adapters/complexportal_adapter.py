@@ -7,16 +7,22 @@ Loads curated protein complex data from ComplexPortal TSV files and generates:
 """
 
 import re
+import sys
 import json
 from pathlib import Path
 from biocypher._logger import logger
 
+_COMPONENT_RE = re.compile(r'([A-Z0-9_-]+)\((\d+)\)')
+_GO_RE = re.compile(r'(GO:\d+)')
+
 
 class ComplexPortalAdapter:
     def __init__(self, data_dir="template_package/data/complexportal",
                  ortholog_file="template_package/mappings/mouse_to_human_orthologs.json"):
         self.data_dir = data_dir
-        self.complexes = []
+        self.complexes = []   # (complex_ac, node properties)
+        # flat (complex_ac, human_id, stoichiometry, species, original_id or None)
+        self.components = []
         self.orthologs = {}
         self._load_orthologs(ortholog_file)
         self._load_data()
@@ -52,15 +58,21 @@ class ComplexPortalAdapter:
             part = part.strip()
             if not part:
                 continue
+            # IDs are interned: the same proteins appear in many complexes
+            if '(' not in part:
+                # Bare ID without stoichiometry, no need for the regex
+                components.append((sys.intern(part), 1))
+                continue
+
             # Match pattern: UNIPROT_ID(stoichiometry) or just UNIPROT_ID
-            match = re.match(r'([A-Z0-9_-]+)\((\d+)\)', part)
+            match = _COMPONENT_RE.match(part)
             if match:
                 uid = match.group(1)
                 stoich = int(match.group(2))
-                components.append((uid, stoich))
+                components.append((sys.intern(uid), stoich))
             else:
                 # Just a bare ID
-                components.append((part, 1))
+                components.append((sys.intern(part), 1))
 
         return components
 
@@ -71,9 +83,9 @@ class ComplexPortalAdapter:
             return go_terms
 
         for part in go_str.split('|'):
-            match = re.match(r'(GO:\d+)', part.strip())
+            match = _GO_RE.match(part.strip())
             if match:
-                go_terms.append(match.group(1))
+                go_terms.append(sys.intern(match.group(1)))
 
         return go_terms
 
@@ -88,44 +100,64 @@ class ComplexPortalAdapter:
                 logger.warning(f"ComplexPortal: {species_file} not found, skipping")
                 continue
 
-            logger.info(f"ComplexPortal: Loading {species_file}...")
-            with open(filepath, 'r', encoding='utf-8') as f:
-                header = None
-                for line in f:
-                    if line.startswith('#'):
-                        # Parse header
-                        header = line.lstrip('#').strip().split('\t')
-                        continue
-                    if not line.strip():
-                        continue
-
-                    fields = line.strip().split('\t')
-                    if len(fields) < 10:
-                        continue
-
-                    complex_data = {
-                        'complex_ac': fields[0].strip(),
-                        'name': self._sanitize(fields[1].strip()),
-                        'aliases': self._sanitize(fields[2].strip()) if len(fields) > 2 else '',
-                        'taxid': taxid,
-                        'species': species_name,
-                        'components_str': fields[4].strip() if len(fields) > 4 else '',
-                        'go_annotations': self._parse_go_annotations(
-                            fields[7].strip() if len(fields) > 7 else ''),
-                        'description': self._sanitize(
-                            fields[9].strip() if len(fields) > 9 else ''),
-                        'complex_assembly': self._sanitize(
-                            fields[11].strip() if len(fields) > 11 else ''),
-                    }
-
-                    # Parse components
-                    complex_data['components'] = self._parse_components(
-                        complex_data['components_str'])
-
-                    self.complexes.append(complex_data)
+            complexes, components = self._load_species(filepath, species_name)
+            self.complexes.extend(complexes)
+            self.components.extend(components)
 
         logger.info(f"ComplexPortal: Loaded {len(self.complexes)} complexes total")
 
+    def _load_species(self, filepath, species_name):
+        """Parse one species TSV into (complexes, components) lists."""
+        complexes = []
+        components_flat = []
+
+        logger.info(f"ComplexPortal: Loading {filepath.name}...")
+        # 1 MiB read buffer instead of the 8 KiB default
+        with open(filepath, 'r', encoding='utf-8', buffering=1 << 20) as f:
+            header = None
+            for line in f:
+                if line.startswith('#'):
+                    # Parse header
+                    header = line.lstrip('#').strip().split('\t')
+                    continue
+                if not line.strip():
+                    continue
+
+                fields = line.strip().split('\t')
+                if len(fields) < 10:
+                    continue
+
+                complex_ac = fields[0].strip()
+
+                # Parse components
+                components = self._parse_components(
+                    fields[4].strip() if len(fields) > 4 else '')
+
+                props = {
+                    'name': self._sanitize(fields[1].strip()),
+                    'aliases': self._sanitize(fields[2].strip()) if len(fields) > 2 else '',
+                    'description': self._sanitize(
+                        fields[9].strip() if len(fields) > 9 else ''),
+                    'complex_assembly': self._sanitize(
+                        fields[11].strip() if len(fields) > 11 else ''),
+                    'species': species_name,
+                    'go_annotations': self._parse_go_annotations(
+                        fields[7].strip() if len(fields) > 7 else ''),
+                    'num_components': len(components),
+                }
+                complexes.append((complex_ac, props))
+
+                # Components are kept as one flat list, already mapped to
+                # human IDs, so get_edges is a plain scan
+                for uid, stoich in components:
+                    human_id = self._map_to_human(uid, species_name)
+                    # If it was a mouse protein, track the original ID
+                    original_id = uid if human_id != uid else None
+                    components_flat.append(
+                        (complex_ac, human_id, stoich, species_name, original_id))
+
+        return complexes, components_flat
+
     def _map_to_human(self, uniprot_id, species):
         """Map a protein ID to human ortholog if mouse."""
         if species == 'Mus musculus':
@@ -143,24 +175,15 @@ class ComplexPortalAdapter:
         # Also collect unique Gene nodes from complex components
         gene_nodes = set()
 
-        for cpx in self.complexes:
-            props = {
-                'name': cpx['name'],
-                'aliases': cpx['aliases'],
-                'description': cpx['description'],
-                'complex_assembly': cpx['complex_assembly'],
-                'species': cpx['species'],
-                'go_annotations': cpx['go_annotations'],
-                'num_components': len(cpx['components']),
-            }
-
-            yield (cpx['complex_ac'], "ProteinComplex", props)
+        for complex_ac, props in self.complexes:
+            # BioCypher fills missing schema properties into the dict it is
+            # given; hand out a copy so the stored props stay untouched
+            yield (complex_ac, "ProteinComplex", dict(props))
             node_count += 1
 
-            # Track gene nodes (don't yield them - they may already exist from LIANA)
-            for uid, _ in cpx['components']:
-                human_id = self._map_to_human(uid, cpx['species'])
-                gene_nodes.add(human_id)
+        # Track gene nodes (don't yield them - they may already exist from LIANA)
+        for _, human_id, _, _, _ in self.components:
+            gene_nodes.add(human_id)
 
         logger.info(f"ComplexPortal: Generated {node_count} ProteinComplex nodes "
                      f"(referencing {len(gene_nodes)} unique genes)")
@@ -173,26 +196,22 @@ class ComplexPortalAdapter:
         logger.info("ComplexPortal: Generating edges...")
         edge_count = 0
 
-        for cpx in self.complexes:
-            for uid, stoich in cpx['components']:
-                human_id = self._map_to_human(uid, cpx['species'])
-
-                props = {
-                    'stoichiometry': stoich,
-                    'species': cpx['species'],
-                }
+        for complex_ac, human_id, stoich, species, original_id in self.components:
+            props = {
+                'stoichiometry': stoich,
+                'species': species,
+            }
 
-                # If it was a mouse protein, track the original ID
-                if cpx['species'] == 'Mus musculus' and human_id != uid:
-                    props['original_id'] = uid
-
-                yield (
-                    None,
-                    cpx['complex_ac'],
-                    human_id,
-                    "ComplexContainsProtein",
-                    props
-                )
-                edge_count += 1
+            if original_id is not None:
+                props['original_id'] = original_id
+
+            yield (
+                None,
+                complex_ac,
+                human_id,
+                "ComplexContainsProtein",
+                props
+            )
+            edge_count += 1
 
         logger.info(f"ComplexPortal: Generated {edge_count} ComplexContainsProtein edges")
@@ -8,16 +8,37 @@ ComPPI integrates PPIs with subcellular localization data from multiple
 databases, assigning interaction scores based on compartmental evidence.
 """
 
-import gzip
+import io
 import csv
+import sys
+from array import array
 from pathlib import Path
 from biocypher._logger import logger
 
+# ISA-L's igzip is a drop-in, several times faster replacement for gzip
+try:
+    from isal import igzip as gzip
+except ImportError:
+    import gzip
+
+
+def _open_gz(path, errors='strict'):
+    """Open a gzipped text file for streaming reads through a 1 MiB buffer."""
+    raw = io.BufferedReader(gzip.open(path, 'rb'), buffer_size=1 << 20)
+    return io.TextIOWrapper(raw, encoding='utf-8', errors=errors)
+
 
 class ComPPIAdapter:
     def __init__(self, data_dir="template_package/data/comppi"):
         self.data_dir = Path(data_dir)
-        self.interactions = []
+        # Column-wise storage (one list per field) instead of a dict per interaction
+        self.interactions = {
+            'prot_a': [],
+            'prot_b': [],
+            'score': array('d'),
+            'system_type': [],
+            'source_db': [],
+        }
         self._load_data()
 
     def _sanitize(self, text):
@@ -38,39 +59,66 @@ class ComPPIAdapter:
         logger.info("ComPPI: Loading compartmentalized PPIs...")
         count = 0
         skipped = 0
+        duplicates = 0
+        seen = set()
+        cols = self.interactions
+
+        with _open_gz(ppi_path, errors='replace') as f:
+            reader = csv.reader(f, delimiter='\t')
+            header = next(reader, [])
+            # Resolve column positions once instead of building a dict per
+            # row. Missing columns point one past the header, at the ''
+            # slot every row is padded with below.
+            width = len(header)
+            col = {name.strip(): i for i, name in enumerate(header)}
+            i_a = col.get('Protein A', width)
+            i_b = col.get('Protein B', width)
+            i_score = col.get('Interaction Score', width)
+            i_sys = col.get('Interaction Experimental System Type', width)
+            i_db = col.get('Interaction Source Database', width)
 
-        with gzip.open(ppi_path, 'rt', encoding='utf-8', errors='replace') as f:
-            reader = csv.DictReader(f, delimiter='\t')
             for row in reader:
-                prot_a = row.get('Protein A', '').strip()
-                prot_b = row.get('Protein B', '').strip()
-                score = row.get('Interaction Score', '').strip()
-                sys_type = row.get('Interaction Experimental System Type', '').strip()
-                source_db = row.get('Interaction Source Database', '').strip()
+                if len(row) < width:
+                    row.extend([''] * (width - len(row)))
+                row[width:] = ['']
+
+                prot_a = row[i_a].strip()
+                prot_b = row[i_b].strip()
+                score = row[i_score].strip()
+                sys_type = row[i_sys].strip()
+                source_db = row[i_db].strip()
 
                 if not prot_a or not prot_b:
                     skipped += 1
                     continue
 
                 try:
-                    score_val = float(score)
-                except (ValueError, TypeError):
+                    score_val = float(score) if score else 0.0
+                except ValueError:
                     score_val = 0.0
 
-                self.interactions.append({
-                    'prot_a': prot_a,
-                    'prot_b': prot_b,
-                    'score': score_val,
-                    'system_type': sys_type,
-                    'source_db': source_db,
-                })
+                # Cap at 500K rows read for memory (duplicates included)
                 count += 1
-
-                # Cap at 500K for memory
-                if count >= 500000:
+                if count > 500000:
                     break
 
-        logger.info(f"ComPPI: Loaded {count} interactions (skipped {skipped})")
+                # Deduplicate A-B / B-A, keeping the first occurrence
+                key = (prot_a, prot_b) if prot_a <= prot_b else (prot_b, prot_a)
+                if key in seen:
+                    duplicates += 1
+                    continue
+                seen.add(key)
+
+                # Proteins recur across many interactions and the system type /
+                # source database columns have a handful of values: intern them
+                cols['prot_a'].append(sys.intern(prot_a))
+                cols['prot_b'].append(sys.intern(prot_b))
+                cols['score'].append(score_val)
+                cols['system_type'].append(sys.intern(sys_type))
+                cols['source_db'].append(sys.intern(source_db))
+
+        logger.info(f"ComPPI: Loaded {len(cols['prot_a'])} unique interactions "
+                    f"({duplicates} duplicates, skipped {skipped})")
 
     def get_nodes(self):
         """No new nodes - uses existing Gene nodes."""
@@ -83,27 +131,25 @@ class ComPPIAdapter:
         Yields: (id, source, target, label, properties)
         """
         logger.info("ComPPI: Generating edges...")
-        seen = set()
         count = 0
 
-        for inter in self.interactions:
-            # Deduplicate A-B / B-A
-            key = tuple(sorted([inter['prot_a'], inter['prot_b']]))
-            if key in seen:
-                continue
-            seen.add(key)
-
+        cols = self.interactions
+        rows = zip(
+            cols['prot_a'], cols['prot_b'], cols['score'],
+            cols['system_type'], cols['source_db'],
+        )
+        for prot_a, prot_b, score, sys_type, source_db in rows:
             props = {
-                'interaction_score': inter['score'],
-                'system_type': self._sanitize(inter['system_type']),
-                'source_db': self._sanitize(inter['source_db']),
+                'interaction_score': score,
+                'system_type': self._sanitize(sys_type),
+                'source_db': self._sanitize(source_db),
                 'source': 'ComPPI',
             }
 
             yield (
                 None,
-                inter['prot_a'],
-                inter['prot_b'],
+                prot_a,
+                prot_b,
                 "CompartmentalizedInteraction",
                 props
             )
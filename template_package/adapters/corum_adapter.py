@@ -18,15 +18,39 @@ Disease comment, PMID
 
 import zipfile
 import io
+import sys
+from collections import Counter
 from pathlib import Path
 from biocypher._logger import logger
 
+# Row field -> (CORUM header name, alternative lower-case header name)
+_COLUMNS = {
+    'organism': ('Organism', 'organism'),
+    'complex_id': ('ComplexID', 'complex_id'),
+    'name': ('ComplexName', 'complex_name'),
+    'subunits': ('subunits(UniProt IDs)', 'subunits_uniprot_id'),
+    'synonyms': ('Synonyms', 'synonyms'),
+    'cell_line': ('Cell line', 'cell_line'),
+    'purification_method': ('Protein complex purification method',
+                            'purification_method'),
+    'go_id': ('GO ID', 'go_id'),
+    'go_description': ('GO description', 'go_description'),
+    'funcat_id': ('FunCat ID', 'funcat_id'),
+    'funcat_description': ('FunCat description', 'funcat_description'),
+    'gene_names': ('subunits(Gene name)', 'subunits_gene_name'),
+    'disease_comment': ('Disease comment', 'disease_comment'),
+    'pmid': ('PMID', 'pmid'),
+}
+
 
 class CORUMAdapter:
     def __init__(self, data_dir="template_package/data/corum"):
         self.data_dir = Path(data_dir)
-        self.complexes = {}
-        self.subunits = []
+        self.files = []  # (path, zip member name or None)
+        self._human_organisms = {}  # Organism value -> _is_human result
+        self.complexes = {}  # corum_id -> info of its first row
+        self.component_counts = Counter()  # corum_id -> subunit links
+        self.subunits = []  # (corum_id, protein_id) membership links
         self._load_data()
 
     def _sanitize(self, text):
@@ -49,7 +73,8 @@ class CORUMAdapter:
         """
         Parse semicolon-delimited UniProt subunit IDs.
         Example: 'P84022;Q13485;Q15796' -> ['P84022', 'Q13485', 'Q15796']
-        Handles None, empty strings, and whitespace.
+        Handles None, empty strings, and whitespace. IDs are interned: the
+        same proteins recur across many complexes and every link is kept.
         """
         if not subunits_str or subunits_str.strip() in ('', '-', 'None'):
             return []
@@ -57,28 +82,25 @@ class CORUMAdapter:
         for part in subunits_str.split(';'):
             uid = part.strip()
             if uid and uid != '-' and uid != 'None':
-                parts.append(uid)
+                parts.append(sys.intern(uid))
         return parts
 
     def _load_data(self):
-        """Load CORUM complex data from TSV files, including inside zip archives."""
+        """
+        Locate valid CORUM TSV files, including inside zip archives, and
+        parse them once into complexes and subunit links.
+        """
         if not self.data_dir.exists():
             logger.warning(f"CORUM: Data directory not found: {self.data_dir}")
             return
 
-        files_parsed = 0
-
         # First try zip archives (CORUM sometimes distributes as .zip)
         for zf in self.data_dir.glob("*.zip"):
             try:
                 with zipfile.ZipFile(zf, 'r') as z:
                     for name in z.namelist():
                         if name.endswith('.txt') or name.endswith('.tsv'):
-                            with z.open(name) as f:
-                                reader = io.TextIOWrapper(
-                                    f, encoding='utf-8', errors='replace')
-                                self._parse_tsv(reader)
-                                files_parsed += 1
+                            self.files.append((zf, name))
             except Exception as e:
                 logger.warning(f"CORUM: Error reading {zf}: {e}")
 
@@ -88,34 +110,62 @@ class CORUMAdapter:
             try:
                 with open(fpath, 'r', encoding='utf-8', errors='replace') as f:
                     first_line = f.readline()
-                    # Skip HTML error pages or very short/corrupt files
-                    if first_line.strip().startswith('<') or \
-                            first_line.strip().startswith('404') or \
-                            len(first_line.strip()) < 10:
-                        logger.warning(
-                            f"CORUM: {fpath.name} appears invalid, skipping")
-                        continue
-                    f.seek(0)
-                    self._parse_tsv(f)
-                    files_parsed += 1
+                # Skip HTML error pages or very short/corrupt files
+                if first_line.strip().startswith('<') or \
+                        first_line.strip().startswith('404') or \
+                        len(first_line.strip()) < 10:
+                    logger.warning(
+                        f"CORUM: {fpath.name} appears invalid, skipping")
+                    continue
+                self.files.append((fpath, None))
             except Exception as e:
                 logger.warning(f"CORUM: Error reading {fpath}: {e}")
 
-        if files_parsed == 0:
+        if not self.files:
             logger.warning(
                 f"CORUM: No valid data files found in {self.data_dir}. "
                 "Expected allComplexes.txt or coreComplexes.txt"
             )
 
+        logger.info(f"CORUM: Found {len(self.files)} data files")
+
+        for corum_id, info, subunits in self._iter_rows():
+            # A complex ID may appear on several rows: the first one
+            # provides the info, and num_components counts the subunit
+            # links over all of them
+            if corum_id not in self.complexes:
+                self.complexes[corum_id] = info
+            self.component_counts[corum_id] += len(subunits)
+            for protein_id in subunits:
+                self.subunits.append((corum_id, protein_id))
+
         logger.info(
             f"CORUM: Loaded {len(self.complexes)} human complexes, "
             f"{len(self.subunits)} subunit links"
         )
 
+    def _iter_rows(self):
+        """
+        Parse all CORUM files, yielding (corum_id, info, subunits) for every
+        human complex row. A complex ID may appear on several rows.
+        """
+        for path, member in self.files:
+            try:
+                if member is None:
+                    with open(path, 'r', encoding='utf-8', errors='replace') as f:
+                        yield from self._parse_tsv(f)
+                else:
+                    with zipfile.ZipFile(path, 'r') as z, z.open(member) as f:
+                        reader = io.TextIOWrapper(
+                            f, encoding='utf-8', errors='replace')
+                        yield from self._parse_tsv(reader)
+            except Exception as e:
+                logger.warning(f"CORUM: Error reading {path}: {e}")
+
     def _parse_tsv(self, fh):
         """
         Parse a CORUM TSV file from a file handle.
-        Filters for human complexes and extracts complex + subunit data.
+        Filters for human complexes and yields (corum_id, info, subunits).
         """
         header = None
         for line in fh:
@@ -130,81 +180,70 @@ class CORUMAdapter:
             # First non-empty line is the header
             if header is None:
                 header = parts
+                # Resolve column positions once instead of building a dict
+                # per row. Missing columns point one past the header, at the
+                # '' slot every row is padded with below.
+                width = len(header)
+                col = {name: i for i, name in enumerate(header)}
+                idx = {
+                    field: col.get(name, col.get(alt, width))
+                    for field, (name, alt) in _COLUMNS.items()
+                }
+                i_org = idx['organism']
+                if i_org == width:
+                    # No organism column: no row can pass the human filter
+                    return
+                i_id = idx['complex_id']
+                i_name = idx['name']
+                i_subunits = idx['subunits']
+                info_idx = [
+                    (field, idx[field]) for field in _COLUMNS
+                    if field not in ('organism', 'complex_id', 'name', 'subunits')
+                ]
                 continue
 
             if len(parts) < 5:
                 continue
 
-            row = dict(zip(header, parts))
-
-            # Filter for human complexes only
-            organism = row.get('Organism', row.get('organism', ''))
-            if not self._is_human(organism):
+            # Filter for human complexes only, before touching the rest of
+            # the row. The Organism column holds a handful of distinct
+            # values, so the check is memoised per value.
+            organism = parts[i_org] if i_org < len(parts) else ''
+            is_human = self._human_organisms.get(organism)
+            if is_human is None:
+                is_human = self._human_organisms[organism] = self._is_human(organism)
+            if not is_human:
                 continue
 
-            complex_id = row.get(
-                'ComplexID', row.get('complex_id', '')).strip()
+            # Pad short rows and cut long ones so every index above is valid
+            if len(parts) < width:
+                parts.extend([''] * (width - len(parts)))
+            parts[width:] = ['']
+
+            complex_id = parts[i_id].strip()
             if not complex_id:
                 continue
 
             corum_id = f"CORUM:{complex_id}"
-            complex_name = row.get(
-                'ComplexName', row.get('complex_name', ''))
 
             # Extract subunit UniProt IDs
-            subunits_str = row.get(
-                'subunits(UniProt IDs)',
-                row.get('subunits_uniprot_id', ''))
-            parsed_subunits = self._parse_subunits(subunits_str)
+            parsed_subunits = self._parse_subunits(parts[i_subunits])
 
-            # Store complex info (deduplicated by ID)
-            if corum_id not in self.complexes:
-                self.complexes[corum_id] = {
-                    'name': complex_name,
-                    'organism': organism,
-                    'synonyms': row.get('Synonyms', row.get('synonyms', '')),
-                    'cell_line': row.get(
-                        'Cell line', row.get('cell_line', '')),
-                    'purification_method': row.get(
-                        'Protein complex purification method',
-                        row.get('purification_method', '')),
-                    'go_id': row.get('GO ID', row.get('go_id', '')),
-                    'go_description': row.get(
-                        'GO description', row.get('go_description', '')),
-                    'funcat_id': row.get(
-                        'FunCat ID', row.get('funcat_id', '')),
-                    'funcat_description': row.get(
-                        'FunCat description',
-                        row.get('funcat_description', '')),
-                    'gene_names': row.get(
-                        'subunits(Gene name)',
-                        row.get('subunits_gene_name', '')),
-                    'disease_comment': row.get(
-                        'Disease comment', row.get('disease_comment', '')),
-                    'pmid': row.get('PMID', row.get('pmid', '')),
-                }
+            info = {'name': parts[i_name], 'organism': organism}
+            for field, i in info_idx:
+                info[field] = parts[i]
 
-            # Store subunit links
-            for uid in parsed_subunits:
-                self.subunits.append({
-                    'complex_id': corum_id,
-                    'protein_id': uid,
-                })
+            yield corum_id, info, parsed_subunits
 
     def get_nodes(self):
         """
         Generate ProteinComplex nodes from CORUM data.
         Yields: (id, label, properties)
         """
-        logger.info(
-            f"CORUM: Generating nodes from {len(self.complexes)} complexes..."
-        )
+        logger.info("CORUM: Generating nodes...")
         count = 0
 
         for corum_id, info in self.complexes.items():
-            num_components = sum(
-                1 for s in self.subunits if s['complex_id'] == corum_id)
-
             props = {
                 'name': self._sanitize(info['name']),
                 'aliases': self._sanitize(info.get('synonyms', '')),
@@ -213,7 +252,7 @@ class CORUMAdapter:
                 'complex_assembly': '',
                 'species': 'Homo sapiens',
                 'go_annotations': [],
-                'num_components': num_components,
+                'num_components': self.component_counts[corum_id],
                 'go_id': self._sanitize(info.get('go_id', '')),
                 'funcat_id': self._sanitize(info.get('funcat_id', '')),
                 'funcat_description': self._sanitize(
@@ -243,8 +282,8 @@ class CORUMAdapter:
         count = 0
         unique_proteins = set()
 
-        for sub in self.subunits:
-            unique_proteins.add(sub['protein_id'])
+        for corum_id, protein_id in self.subunits:
+            unique_proteins.add(protein_id)
 
             props = {
                 'stoichiometry': 1,
@@ -254,8 +293,8 @@ class CORUMAdapter:
 
             yield (
                 None,
-                sub['complex_id'],
-                sub['protein_id'],
+                corum_id,
+                protein_id,
                 "ComplexContainsProtein",
                 props,
             )
@@ -10,6 +10,7 @@ HPRD, IntAct, BioGRID, and others, providing confidence-scored interactions.
 
 import gzip
 import csv
+import sys
 from pathlib import Path
 from biocypher._logger import logger
 
@@ -38,6 +39,9 @@ class CPDBAdapter:
         logger.info("CPDB: Loading human protein-protein interactions...")
         count = 0
         skipped = 0
+        duplicates = 0
+        seen = set()
+        source_dbs_cache = {}  # raw source_dbs -> sanitized string
 
         with gzip.open(ppi_path, 'rt', encoding='utf-8', errors='replace') as f:
             for line in f:
@@ -64,22 +68,40 @@ class CPDBAdapter:
                     skipped += 1
                     continue
 
-                id_a = ids[0].strip()
-                id_b = ids[1].strip()
+                # Proteins recur across many interactions: intern the IDs so
+                # the stored rows and the dedup keys share one object each
+                id_a = sys.intern(ids[0].strip())
+                id_b = sys.intern(ids[1].strip())
 
                 if not id_a or not id_b:
                     continue
 
+                # Deduplicate A-B / B-A, keeping the first occurrence
+                key = (id_a, id_b) if id_a <= id_b else (id_b, id_a)
+                if key in seen:
+                    duplicates += 1
+                    continue
+                seen.add(key)
+
+                # Source database lists are a few recurring combinations:
+                # sanitize each distinct one once and share the result
+                dbs = source_dbs_cache.get(source_dbs)
+                if dbs is None:
+                    dbs = source_dbs_cache[source_dbs] = self._sanitize(source_dbs)
+
                 self.interactions.append({
                     'id_a': id_a,
                     'id_b': id_b,
-                    'source_dbs': source_dbs,
-                    'num_publications': len(publications.split(',')) if publications else 0,
+                    # Stored already sanitized for CSV output
+                    'source_dbs': dbs,
+                    # Comma count + 1 gives the number of IDs without splitting
+                    'num_publications': publications.count(',') + 1 if publications else 0,
                     'confidence': confidence,
                 })
                 count += 1
 
-        logger.info(f"CPDB: Loaded {count} binary interactions (skipped {skipped} non-binary)")
+        logger.info(f"CPDB: Loaded {count} unique binary interactions "
+                    f"({duplicates} duplicates, skipped {skipped} non-binary)")
 
     def get_nodes(self):
         """
@@ -94,18 +116,12 @@ class CPDBAdapter:
         Yields: (id, source, target, label, properties)
         """
         logger.info("CPDB: Generating edges...")
-        seen = set()
         count = 0
 
+        # Interactions were deduplicated at load time
         for inter in self.interactions:
-            # Deduplicate: A-B same as B-A
-            key = tuple(sorted([inter['id_a'], inter['id_b']]))
-            if key in seen:
-                continue
-            seen.add(key)
-
             props = {
-                'source_databases': self._sanitize(inter['source_dbs']),
+                'source_databases': inter['source_dbs'],
                 'num_publications': inter['num_publications'],
                 'confidence': inter['confidence'],
                 'source': 'CPDB',
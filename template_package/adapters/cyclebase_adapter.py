@@ -7,15 +7,23 @@ and CDK/cyclin protein annotations.
 Yields CellCycleRegulation edges linking proteins to cell cycle phases/functions.
 """
 
+import sys
 from pathlib import Path
 from biocypher._logger import logger
 
+# Cell cycle terms looked up in the lower-cased Keywords field, in output order
+_PHASE_TERMS = (
+    "cell cycle", "cell division", "mitosis", "meiosis",
+    "g1/s", "g2/m", "s phase", "m phase",
+    "apoptosis", "dna damage", "dna repair",
+    "kinetochore", "centromere", "chromosome",
+)
+
 
 class CyclebaseAdapter:
     def __init__(self, data_dir="template_package/data/cyclebase"):
         self.data_dir = Path(data_dir)
         self.entries = []
-        self._seen_keys = set()
         self._load_data()
 
     def _sanitize(self, text):
@@ -32,13 +40,7 @@ class CyclebaseAdapter:
             return ""
         kw_lower = keywords_str.lower()
         phases = []
-        phase_terms = [
-            "cell cycle", "cell division", "mitosis", "meiosis",
-            "g1/s", "g2/m", "s phase", "m phase",
-            "apoptosis", "dna damage", "dna repair",
-            "kinetochore", "centromere", "chromosome",
-        ]
-        for term in phase_terms:
+        for term in _PHASE_TERMS:
             if term in kw_lower:
                 phases.append(term)
         return "; ".join(phases) if phases else "cell cycle"
@@ -101,34 +103,49 @@ class CyclebaseAdapter:
             if not header_line or header_line.startswith('<'):
                 return
             headers = header_line.split('\t')
+            # Resolve column positions once instead of building a dict per
+            # row. Missing columns point one past the header, at the ''
+            # slot every row is padded with below.
+            width = len(headers)
+            col = {name: i for i, name in enumerate(headers)}
+            i_entry = col.get('Entry', width)
+            i_genes = col.get('Gene Names', width)
+            i_keywords = col.get('Keywords', width)
+            i_go_bp = col.get('Gene Ontology (biological process)', width)
+            i_function = col.get('Function [CC]', width)
+            i_protein = col.get('Protein names', width)
+            seen_ids = set()
 
             for line in fh:
                 line = line.strip()
                 if not line:
                     continue
                 parts = line.split('\t')
-                row = dict(zip(headers, parts))
+                if len(parts) < width:
+                    parts.extend([''] * (width - len(parts)))
+                parts[width:] = ['']
 
-                uniprot_id = row.get('Entry', '').strip()
+                uniprot_id = parts[i_entry].strip()
                 if not uniprot_id:
                     continue
+                # The same protein shows up in several of the datasets
+                uniprot_id = sys.intern(uniprot_id)
+
+                # Dedup by (uniprot_id, dataset); each file is one dataset
+                if uniprot_id in seen_ids:
+                    continue
+                seen_ids.add(uniprot_id)
 
                 # Extract gene name (first gene in the "Gene Names" field)
-                gene_names_raw = row.get('Gene Names', '').strip()
+                gene_names_raw = parts[i_genes].strip()
                 gene_name = gene_names_raw.split()[0] if gene_names_raw else ""
 
-                # Dedup by (uniprot_id, dataset)
-                dedup_key = (uniprot_id, dataset)
-                if dedup_key in self._seen_keys:
-                    continue
-                self._seen_keys.add(dedup_key)
-
-                keywords = row.get('Keywords', '').strip()
+                keywords = parts[i_keywords].strip()
                 phase = self._extract_phase_from_keywords(keywords)
-                go_bp = row.get('Gene Ontology (biological process)', '').strip()
-                function_cc = row.get('Function [CC]', '').strip()
+                go_bp = parts[i_go_bp].strip()
+                function_cc = parts[i_function].strip()
                 func_summary = self._extract_function_summary(function_cc)
-                protein_name = row.get('Protein names', '').strip()
+                protein_name = parts[i_protein].strip()
 
                 self.entries.append({
                     'uniprot_id': uniprot_id,
@@ -28,16 +28,93 @@ Reference:
   Nucleic Acids Res. 2019 Jan;47(D1):D298-D308.
 """
 
-import gzip
+import io
+import os
 import re
+import sys
+from functools import lru_cache
 from pathlib import Path
 from biocypher._logger import logger
 
+# ISA-L's igzip is a drop-in, several times faster replacement for gzip
+try:
+    from isal import igzip as gzip
+except ImportError:
+    import gzip
+
+
+def _open_gz(path, errors='strict'):
+    """Open a gzipped text file for streaming reads through a 1 MiB buffer."""
+    raw = io.BufferedReader(gzip.open(path, 'rb'), buffer_size=1 << 20)
+    return io.TextIOWrapper(raw, encoding='utf-8', errors=errors)
+
+
+def _starts_with_markup(f):
+    """Check whether a text file opens with '<' (an HTML error page).
+
+    Peeks at the underlying byte buffer, so nothing is consumed and the
+    stream never has to be rewound (a gzip seek restarts decompression).
+    """
+    head = f.buffer.peek(1).lstrip(b' \t\r\f\v')
+    return head.startswith(b'<')
+
+
+# Data file suffixes, in the order files are loaded
+_DATA_SUFFIXES = ('.tsv.gz', '.txt.gz', '.tsv', '.txt')
+
+# Accepted header names for each dbPTM tabular field, in order of preference
+_ACC_COLUMNS = ('UniProtKB_AC', 'UniProt_AC', 'uniprot_ac', 'uniprot_id',
+                'ACC', 'Protein', 'accession', 'Entry')
+_POSITION_COLUMNS = ('Position', 'position', 'Site')
+_PTM_TYPE_COLUMNS = ('PTM_type', 'PTM type', 'ptm_type', 'Modification', 'Type')
+_RESIDUE_COLUMNS = ('Residue', 'residue', 'AA')
+_PMID_COLUMNS = ('PMIDs', 'PMID', 'pmids', 'PubMed', 'Reference', 'References')
+
+
+# Common dbPTM type strings (lower-cased) -> canonical PTM type names
+_PTM_TYPE_NAMES = {
+    'phosphorylation': 'Phosphorylation',
+    'acetylation': 'Acetylation',
+    'ubiquitination': 'Ubiquitination',
+    'ubiquitylation': 'Ubiquitination',
+    'sumoylation': 'SUMOylation',
+    'methylation': 'Methylation',
+    'glycosylation': 'Glycosylation',
+    'n-linked glycosylation': 'N-Glycosylation',
+    'o-linked glycosylation': 'O-Glycosylation',
+    's-nitrosylation': 'S-Nitrosylation',
+    'succinylation': 'Succinylation',
+    'malonylation': 'Malonylation',
+    'palmitoylation': 'Palmitoylation',
+    'myristoylation': 'Myristoylation',
+    'hydroxylation': 'Hydroxylation',
+    'crotonylation': 'Crotonylation',
+    'neddylation': 'Neddylation',
+    'sulfation': 'Sulfation',
+    'sulphation': 'Sulfation',
+    'citrullination': 'Citrullination',
+    'nitration': 'Nitration',
+    'oxidation': 'Oxidation',
+    'glutathionylation': 'Glutathionylation',
+    'formylation': 'Formylation',
+}
+
+
+@lru_cache(maxsize=256)
+def _normalise_ptm_type(raw):
+    """Map common dbPTM type strings to canonical names.
+
+    Cached: the PTM type column holds only a few dozen distinct values.
+    """
+    if not raw:
+        return ''
+    return _PTM_TYPE_NAMES.get(raw.lower().strip(), raw.strip())
+
 
 class DbPTMAdapter:
     def __init__(self, data_dir="template_package/data/dbptm"):
         self.data_dir = Path(data_dir)
-        self.ptms = []
+        self.files = []
         self._load_data()
 
     def _sanitize(self, text):
@@ -51,68 +128,81 @@ class DbPTMAdapter:
 
     def _load_data(self):
         """
-        Locate and load dbPTM data files.
+        Locate dbPTM data files.
 
-        Searches for .tsv.gz, .txt.gz, .tsv, and .txt files. Each candidate
-        is tested: HTML pages and corrupt gzip files are skipped. The file
-        format is auto-detected (standard dbPTM columnar vs. UniProt MOD_RES
-        flat annotation).
+        Searches for .tsv.gz, .txt.gz, .tsv, and .txt files. Parsing happens
+        on demand in get_edges, so no PTM records are held in memory.
         """
         if not self.data_dir.exists():
             logger.warning("dbPTM: data directory not found")
             return
 
-        candidates = (
-            list(self.data_dir.glob("*.tsv.gz"))
-            + list(self.data_dir.glob("*.txt.gz"))
-            + list(self.data_dir.glob("*.tsv"))
-            + list(self.data_dir.glob("*.txt"))
-        )
+        # One directory scan; files are ordered by suffix priority, then
+        # name, since the first file to contain a record wins deduplication
+        candidates = []
+        with os.scandir(self.data_dir) as entries:
+            for entry in entries:
+                for rank, suffix in enumerate(_DATA_SUFFIXES):
+                    if entry.name.endswith(suffix):
+                        if entry.is_file():
+                            candidates.append(
+                                (rank, entry.name, Path(entry.path)))
+                        break
 
         if not candidates:
             logger.warning("dbPTM: no data files found in data directory")
             return
 
-        for fpath in candidates:
+        candidates.sort()
+        self.files = [path for _, _, path in candidates]
+        logger.info(f"dbPTM: Found {len(self.files)} candidate data files")
+
+    def _iter_records(self):
+        """
+        Parse all dbPTM files, yielding unique
+        (acc, position, ptm_type, residue, pmids) records.
+
+        Each candidate is tested: HTML pages and corrupt gzip files are
+        skipped. The file format is auto-detected (standard dbPTM columnar
+        vs. UniProt MOD_RES flat annotation).
+        """
+        seen = set()  # dedup key = (acc, position, ptm_type)
+        for fpath in self.files:
             try:
                 if str(fpath).endswith('.gz'):
-                    with gzip.open(fpath, 'rt', errors='replace') as f:
-                        first = f.readline()
-                        if first.lstrip().startswith('<'):
+                    with _open_gz(fpath, errors='replace') as f:
+                        if _starts_with_markup(f):
                             logger.warning(
                                 f"dbPTM: {fpath.name} appears to be HTML "
                                 "or corrupt, skipping"
                             )
                             continue
-                        f.seek(0)
-                        self._parse_auto(f, fpath.name)
+                        yield from self._parse_auto(f, fpath.name, seen)
                 else:
                     with open(fpath, 'r', errors='replace') as f:
-                        first = f.readline()
-                        if first.lstrip().startswith('<'):
+                        if _starts_with_markup(f):
                             logger.warning(
                                 f"dbPTM: {fpath.name} appears to be HTML, "
                                 "skipping"
                             )
                             continue
-                        f.seek(0)
-                        self._parse_auto(f, fpath.name)
-            except (gzip.BadGzipFile, OSError) as e:
+                        yield from self._parse_auto(f, fpath.name, seen)
+            except OSError as e:  # includes BadGzipFile
                 logger.warning(
                     f"dbPTM: Cannot read {fpath.name} (corrupt?): {e}"
                 )
             except Exception as e:
                 logger.warning(f"dbPTM: Error reading {fpath.name}: {e}")
 
-        logger.info(f"dbPTM: Loaded {len(self.ptms)} PTM sites total")
-
-    def _parse_auto(self, fh, filename=""):
+    def _parse_auto(self, fh, filename, seen):
         """
         Auto-detect the file format and dispatch to the correct parser.
 
         If the header contains 'Modified residue' and 'Entry' (UniProt TSV
         export format), the file is parsed as UniProt MOD_RES annotations.
-        Otherwise it is parsed as standard dbPTM columnar format.
+        Otherwise it is parsed as standard dbPTM columnar format. Records
+        whose (accession, position, PTM type) key is already in ``seen`` are
+        dropped, so the first file wins.
         """
         header_line = None
         for line in fh:
@@ -130,20 +220,31 @@ class DbPTMAdapter:
         # Detect UniProt MOD_RES format:
         # columns include 'Entry' and 'Modified residue', and data contains
         # MOD_RES annotation strings rather than simple position/type columns
+        header = header_line.split('\t')
         if 'modified residue' in header_lower and 'entry' in header_lower:
-            self._parse_uniprot_modres(header_line, fh, filename)
+            yield from self._parse_uniprot_modres(header, fh, filename, seen)
         else:
-            self._parse_dbptm_tabular(header_line, fh, filename)
+            yield from self._parse_dbptm_tabular(header, fh, filename, seen)
 
-    def _parse_dbptm_tabular(self, header_line, fh, filename=""):
+    def _parse_dbptm_tabular(self, header, fh, filename, seen):
         """
         Parse standard dbPTM columnar format.
 
         Expected columns (tab-separated):
           UniProtKB_AC, Position, PTM_type, Residue, Modified_residue,
           Source, PMIDs
+
+        ``header`` is the already split header row.
         """
-        header = header_line.split('\t')
+        width = len(header)
+        # Resolve each field's alias columns to positions once; per row the
+        # first non-empty alias wins, as with the old chained .get() calls
+        col = {name: i for i, name in enumerate(header)}
+        acc_idx, pos_idx, type_idx, res_idx, pmid_idx = (
+            [col[name] for name in aliases if name in col]
+            for aliases in (_ACC_COLUMNS, _POSITION_COLUMNS, _PTM_TYPE_COLUMNS,
+                            _RESIDUE_COLUMNS, _PMID_COLUMNS)
+        )
         count = 0
 
         for line in fh:
@@ -159,61 +260,59 @@ class DbPTMAdapter:
             parts = line.split('\t')
             if len(parts) < 3:
                 continue
+            if len(parts) < width:
+                parts.extend([''] * (width - len(parts)))
 
-            row = dict(zip(header, parts))
-
-            acc = (
-                row.get('UniProtKB_AC', '')
-                or row.get('UniProt_AC', '')
-                or row.get('uniprot_ac', '')
-                or row.get('uniprot_id', '')
-                or row.get('ACC', '')
-                or row.get('Protein', '')
-                or row.get('accession', '')
-                or row.get('Entry', '')
-            ).strip()
+            acc = ''
+            for i in acc_idx:
+                acc = parts[i]
+                if acc:
+                    break
+            acc = acc.strip()
 
             if not acc:
                 continue
 
-            position = (
-                row.get('Position', '')
-                or row.get('position', '')
-                or row.get('Site', '')
-            ).strip()
-
-            ptm_type = (
-                row.get('PTM_type', '')
-                or row.get('PTM type', '')
-                or row.get('ptm_type', '')
-                or row.get('Modification', '')
-                or row.get('Type', '')
-            ).strip()
-
-            residue = (
-                row.get('Residue', '')
-                or row.get('residue', '')
-                or row.get('AA', '')
-            ).strip()
-
-            pmids = (
-                row.get('PMIDs', '')
-                or row.get('PMID', '')
-                or row.get('pmids', '')
-                or row.get('PubMed', '')
-                or row.get('Reference', '')
-                or row.get('References', '')
-            ).strip()
-
-            ptm_type_clean = self._normalise_ptm_type(ptm_type)
-
-            self.ptms.append({
-                'acc': acc,
-                'position': position,
-                'ptm_type': ptm_type_clean,
-                'residue': residue,
-                'pmids': pmids,
-            })
+            position = ''
+            for i in pos_idx:
+                position = parts[i]
+                if position:
+                    break
+            position = position.strip()
+
+            ptm_type = ''
+            for i in type_idx:
+                ptm_type = parts[i]
+                if ptm_type:
+                    break
+            ptm_type = ptm_type.strip()
+
+            residue = ''
+            for i in res_idx:
+                residue = parts[i]
+                if residue:
+                    break
+            residue = residue.strip()
+
+            pmids = ''
+            for i in pmid_idx:
+                pmids = parts[i]
+                if pmids:
+                    break
+            pmids = pmids.strip()
+
+            # Accessions repeat once per site and PTM types have a few dozen
+            # values: intern them so the dedup keys share one object
+            acc = sys.intern(acc)
+            ptm_type_clean = sys.intern(_normalise_ptm_type(ptm_type))
+
+            # Deduplicate by accession + position + PTM type (first file wins)
+            key = (acc, position, ptm_type_clean)
+            if key in seen:
+                continue
+            seen.add(key)
+
+            yield acc, position, ptm_type_clean, residue, pmids
             count += 1
 
         if count > 0:
@@ -229,6 +328,9 @@ class DbPTMAdapter:
         r'(?:;\s*/evidence="([^"]*)")?'
     )
 
+    # PubMed references inside UniProt /evidence strings
+    _PUBMED_PATTERN = re.compile(r'PubMed:(\d+)')
+
     # Map common UniProt MOD_RES /note values to (PTM type, residue)
     _MODRES_TYPE_MAP = {
         'phosphoserine': ('Phosphorylation', 'S'),
@@ -303,10 +405,10 @@ class DbPTMAdapter:
         """Extract PubMed IDs from UniProt evidence strings."""
         if not evidence:
             return ''
-        pmids = re.findall(r'PubMed:(\d+)', evidence)
+        pmids = self._PUBMED_PATTERN.findall(evidence)
         return '|'.join(sorted(set(pmids)))
 
-    def _parse_uniprot_modres(self, header_line, fh, filename=""):
+    def _parse_uniprot_modres(self, header, fh, filename, seen):
         """
         Parse UniProt MOD_RES flat annotation format.
 
@@ -316,9 +418,20 @@ class DbPTMAdapter:
         The 'Modified residue' column contains concatenated MOD_RES
         annotation strings, each of the form:
             MOD_RES <position>; /note="<modification>"; /evidence="..."
+
+        ``header`` is the already split header row.
         """
-        header = header_line.split('\t')
+        # Resolve column positions once. Missing columns point one past the
+        # header, at the '' slot every row is padded with below.
+        width = len(header)
+        col = {name: i for i, name in enumerate(header)}
+        acc_idx = col.get('Entry', width)
+        modres_idx = [col[name]
+                      for name in ('Modified residue', 'Modified_residue')
+                      if name in col]
         count = 0
+        note_types = {}  # MOD_RES note -> (ptm_type, residue)
+        evidence_pmids = {}  # /evidence string -> joined PMIDs
 
         for line in fh:
             line = line.strip()
@@ -329,17 +442,21 @@ class DbPTMAdapter:
             if len(parts) < 2:
                 continue
 
-            row = dict(zip(header, parts))
+            if len(parts) < width:
+                parts.extend([''] * (width - len(parts)))
+            parts[width:] = ['']
 
-            acc = (row.get('Entry', '') or '').strip()
+            acc = parts[acc_idx].strip()
             if not acc:
                 continue
+            acc = sys.intern(acc)
 
-            modres_col = (
-                row.get('Modified residue', '')
-                or row.get('Modified_residue', '')
-                or ''
-            ).strip()
+            modres_col = ''
+            for i in modres_idx:
+                modres_col = parts[i]
+                if modres_col:
+                    break
+            modres_col = modres_col.strip()
 
             if not modres_col:
                 continue
@@ -350,16 +467,26 @@ class DbPTMAdapter:
                 note = match.group(2)
                 evidence = match.group(3) or ''
 
-                ptm_type, residue = self._parse_modres_note(note)
-                pmids = self._extract_pmids_from_evidence(evidence)
-
-                self.ptms.append({
-                    'acc': acc,
-                    'position': position_str,
-                    'ptm_type': ptm_type,
-                    'residue': residue,
-                    'pmids': pmids,
-                })
+                # Only a few hundred distinct notes occur, so classify each
+                # one once instead of re-running the keyword cascade
+                parsed = note_types.get(note)
+                if parsed is None:
+                    parsed = note_types[note] = self._parse_modres_note(note)
+                ptm_type, residue = parsed
+
+                key = (acc, position_str, ptm_type)
+                if key in seen:
+                    continue
+                seen.add(key)
+
+                # Large-scale studies cite the same evidence for many
+                # sites; scan each distinct string for PMIDs only once
+                pmids = evidence_pmids.get(evidence)
+                if pmids is None:
+                    pmids = evidence_pmids[evidence] = (
+                        self._extract_pmids_from_evidence(evidence))
+
+                yield acc, position_str, ptm_type, residue, pmids
                 count += 1
 
         if count > 0:
@@ -368,40 +495,6 @@ class DbPTMAdapter:
                 "(UniProt MOD_RES format)"
             )
 
-    @staticmethod
-    def _normalise_ptm_type(raw):
-        """Map common dbPTM type strings to canonical names."""
-        if not raw:
-            return ''
-        lower = raw.lower().strip()
-        mapping = {
-            'phosphorylation': 'Phosphorylation',
-            'acetylation': 'Acetylation',
-            'ubiquitination': 'Ubiquitination',
-            'ubiquitylation': 'Ubiquitination',
-            'sumoylation': 'SUMOylation',
-            'methylation': 'Methylation',
-            'glycosylation': 'Glycosylation',
-            'n-linked glycosylation': 'N-Glycosylation',
-            'o-linked glycosylation': 'O-Glycosylation',
-            's-nitrosylation': 'S-Nitrosylation',
-            'succinylation': 'Succinylation',
-            'malonylation': 'Malonylation',
-            'palmitoylation': 'Palmitoylation',
-            'myristoylation': 'Myristoylation',
-            'hydroxylation': 'Hydroxylation',
-            'crotonylation': 'Crotonylation',
-            'neddylation': 'Neddylation',
-            'sulfation': 'Sulfation',
-            'sulphation': 'Sulfation',
-            'citrullination': 'Citrullination',
-            'nitration': 'Nitration',
-            'oxidation': 'Oxidation',
-            'glutathionylation': 'Glutathionylation',
-            'formylation': 'Formylation',
-        }
-        return mapping.get(lower, raw.strip())
-
     def get_nodes(self):
         """
         No new nodes -- PTM sites are represented as edge properties linking
@@ -417,29 +510,29 @@ class DbPTMAdapter:
 
         Each edge connects a UniProt protein accession to a PTM site
         identifier of the form dbptm:<acc>_<position>_<ptm_type>.
-        Deduplicates by (accession, position, ptm_type).
+        Records are streamed from the data files, already unique by
+        (accession, position, ptm_type).
 
         Yields:
             (edge_id, source_id, target_id, label, properties)
         """
         logger.info("dbPTM: Generating ProteinHasPTM edges...")
-        seen = set()
         count = 0
 
-        for ptm in self.ptms:
-            acc = ptm['acc']
-            position = ptm['position']
-            ptm_type = ptm['ptm_type']
-
-            # Deduplicate by accession + position + PTM type
-            key = (acc, position, ptm_type)
-            if key in seen:
-                continue
-            seen.add(key)
-
+        # Only a few dozen PTM types and residues exist; build each ID tag
+        # and sanitised property value once
+        type_values = {}  # ptm_type -> (ID tag, ptm_type property)
+        residue_values = {}  # residue -> residue property
+        # Records are deduplicated while parsing
+        for acc, position, ptm_type, residue, pmids_raw in self._iter_records():
             # Build target identifier
-            type_tag = ptm_type.replace(' ', '') if ptm_type else 'PTM'
-            residue = ptm['residue']
+            type_value = type_values.get(ptm_type)
+            if type_value is None:
+                type_value = type_values[ptm_type] = (
+                    ptm_type.replace(' ', '') if ptm_type else 'PTM',
+                    self._sanitize(ptm_type) if ptm_type else 'Unknown',
+                )
+            type_tag, ptm_type_prop = type_value
             if residue and position:
                 site_id = f"dbptm:{acc}_{type_tag}_{residue}{position}"
             elif position:
@@ -447,21 +540,28 @@ class DbPTMAdapter:
             else:
                 site_id = f"dbptm:{acc}_{type_tag}_unknown"
 
-            # Normalise PMIDs
-            pmids_raw = ptm['pmids']
-            if pmids_raw:
-                pmids_clean = '|'.join(
-                    p.strip()
-                    for p in pmids_raw.replace(';', ',').split(',')
-                    if p.strip()
-                )
-            else:
+            # Normalise PMIDs; most records carry a single ID
+            if not pmids_raw:
                 pmids_clean = ''
+            elif ',' in pmids_raw or ';' in pmids_raw:
+                pmids_clean = '|'.join([
+                    p for p in map(str.strip,
+                                   pmids_raw.replace(';', ',').split(','))
+                    if p
+                ])
+            else:
+                pmids_clean = pmids_raw.strip()
+
+            residue_prop = residue_values.get(residue)
+            if residue_prop is None:
+                residue_prop = residue_values[residue] = self._sanitize(residue)
 
+            # A fresh dict per edge: BioCypher fills in missing properties
+            # in place, so a shared template would leak between edges
             props = {
                 'site': self._sanitize(position),
-                'ptm_type': self._sanitize(ptm_type) if ptm_type else 'Unknown',
-                'residue': self._sanitize(residue),
+                'ptm_type': ptm_type_prop,
+                'residue': residue_prop,
                 'score': 0,
                 'enzymes': '',
                 'pmids': self._sanitize(pmids_clean),
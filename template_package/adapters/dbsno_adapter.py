@@ -19,6 +19,7 @@ Deduplication key: (uniprot_acc, position).
 """
 
 import re
+import sys
 from pathlib import Path
 from biocypher._logger import logger
 
@@ -26,8 +27,8 @@ from biocypher._logger import logger
 class DbSNOAdapter:
     def __init__(self, data_dir="template_package/data/dbsno"):
         self.data_dir = Path(data_dir)
-        self.sites = []          # list of dicts, one per individual SNO site
-        self._seen_keys = set()  # dedup key = (acc, position)
+        self.csv_files = []
+        self.tsv_files = []
         self._load_data()
 
     # ------------------------------------------------------------------
@@ -47,10 +48,13 @@ class DbSNOAdapter:
         r'(?:\s*;\s*/evidence="([^"]*)")?'
     )
 
+    _PUBMED_RE = re.compile(r'PubMed:(\d+)')
+
     # ------------------------------------------------------------------
     # loading
     # ------------------------------------------------------------------
     def _load_data(self):
+        """Locate dbSNO data files; they are parsed on demand in get_edges."""
         if not self.data_dir.exists():
             logger.warning("dbSNO: data directory not found")
             return
@@ -59,10 +63,7 @@ class DbSNOAdapter:
         for csv_name in ["sno_sites_all_species.csv", "sno_sites_from_uniprot.csv"]:
             fpath = self.data_dir / csv_name
             if fpath.exists():
-                try:
-                    self._parse_dbsno_csv(fpath)
-                except Exception as e:
-                    logger.warning(f"dbSNO: Error reading {csv_name}: {e}")
+                self.csv_files.append(fpath)
 
         # 2. UniProt TSV files containing Modified residue / Lipidation columns
         tsv_files = [
@@ -77,27 +78,41 @@ class DbSNOAdapter:
         for tsv_name in tsv_files:
             fpath = self.data_dir / tsv_name
             if fpath.exists():
-                try:
-                    self._parse_uniprot_tsv(fpath)
-                except Exception as e:
-                    logger.warning(f"dbSNO: Error reading {tsv_name}: {e}")
+                self.tsv_files.append(fpath)
 
         logger.info(
-            f"dbSNO: Loaded {len(self.sites)} S-nitrosylation sites "
-            f"from {len({s['acc'] for s in self.sites})} proteins"
+            f"dbSNO: Found {len(self.csv_files) + len(self.tsv_files)} "
+            "data files"
         )
 
-    def _parse_dbsno_csv(self, fpath):
+    def _iter_sites(self):
+        """
+        Parse all dbSNO files in priority order, yielding unique
+        (acc, gene, position, organism, pmids, evidence) sites.
+        """
+        seen = set()  # dedup key = (acc, position)
+        for fpath in self.csv_files:
+            try:
+                yield from self._parse_dbsno_csv(fpath, seen)
+            except Exception as e:
+                logger.warning(f"dbSNO: Error reading {fpath.name}: {e}")
+        for fpath in self.tsv_files:
+            try:
+                yield from self._parse_uniprot_tsv(fpath, seen)
+            except Exception as e:
+                logger.warning(f"dbSNO: Error reading {fpath.name}: {e}")
+
+    def _parse_dbsno_csv(self, fpath, seen):
         """Parse a dbSNO curated CSV (comma-separated, with header).
 
         Expected columns: uniprot_id, gene_name, [organism,] protein_name,
         position, modification, evidence
         """
-        with open(fpath, "r", errors="replace") as fh:
+        with open(fpath, "r", errors="replace", newline="") as fh:
             header_line = fh.readline()
             if header_line.startswith("<"):
                 return
-            headers = [h.strip() for h in header_line.rstrip("\n").split(",")]
+            headers = [h.strip() for h in header_line.rstrip("\r\n").split(",")]
             col = {h: i for i, h in enumerate(headers)}
 
             acc_idx = col.get("uniprot_id")
@@ -112,8 +127,13 @@ class DbSNOAdapter:
                 return
 
             for line in fh:
-                # Handle quoted fields (evidence may contain commas)
-                parts = self._split_csv_line(line.rstrip("\n"))
+                line = line.rstrip("\r\n")
+                # Quoted fields (evidence may contain commas) need the
+                # quote-aware split; most lines have no quotes at all
+                if '"' in line:
+                    parts = self._split_csv_line(line)
+                else:
+                    parts = line.split(",")
                 if len(parts) <= max(acc_idx, pos_idx):
                     continue
 
@@ -123,9 +143,9 @@ class DbSNOAdapter:
                     continue
 
                 key = (acc, position)
-                if key in self._seen_keys:
+                if key in seen:
                     continue
-                self._seen_keys.add(key)
+                seen.add(key)
 
                 gene = parts[gene_idx].strip() if gene_idx is not None and gene_idx < len(parts) else ""
                 organism = parts[org_idx].strip() if org_idx is not None and org_idx < len(parts) else ""
@@ -134,34 +154,28 @@ class DbSNOAdapter:
                 # Extract PMIDs from evidence strings like "ECO:...|PubMed:12345"
                 pmids = self._extract_pmids(evidence)
 
-                self.sites.append({
-                    "acc": acc,
-                    "gene": gene,
-                    "position": position,
-                    "organism": organism,
-                    "pmids": pmids,
-                    "evidence": evidence,
-                    "source_file": fpath.name,
-                })
+                yield acc, gene, position, organism, pmids, evidence
 
     @staticmethod
     def _split_csv_line(line):
-        """Simple CSV split that respects double-quoted fields."""
-        result = []
-        current = []
-        in_quotes = False
-        for ch in line:
-            if ch == '"':
-                in_quotes = not in_quotes
-            elif ch == ',' and not in_quotes:
-                result.append(''.join(current))
-                current = []
+        """Simple CSV split that respects double-quoted fields.
+
+        Quote state never carries over to the next line, so a stray quote
+        only affects the line it is on. Splitting on '"' first leaves the
+        quoted spans at odd positions, so only the even ones are split on
+        commas.
+        """
+        result = ['']
+        for i, segment in enumerate(line.split('"')):
+            if i % 2:
+                result[-1] += segment
             else:
-                current.append(ch)
-        result.append(''.join(current))
+                pieces = segment.split(',')
+                result[-1] += pieces[0]
+                result.extend(pieces[1:])
         return result
 
-    def _parse_uniprot_tsv(self, fpath):
+    def _parse_uniprot_tsv(self, fpath, seen):
         """Parse a UniProt-style TSV that has Entry/Gene Names columns and a
         Modified residue column containing MOD_RES annotations.  Only
         S-nitrosocysteine sites are extracted."""
@@ -179,6 +193,7 @@ class DbSNOAdapter:
 
             if acc_idx is None or modres_idx is None:
                 return
+            evidence_pmids = {}  # /evidence string -> joined PMIDs
 
             for line in fh:
                 parts = line.rstrip("\n").split("\t")
@@ -193,33 +208,33 @@ class DbSNOAdapter:
                 gene_raw = parts[gene_idx].strip() if gene_idx is not None and gene_idx < len(parts) else ""
                 gene = gene_raw.split()[0] if gene_raw else ""
                 organism = parts[organism_idx].strip() if organism_idx is not None and organism_idx < len(parts) else ""
+                # One protein can carry several sites; share its strings
+                acc = sys.intern(acc)
+                gene = sys.intern(gene)
+                organism = sys.intern(organism)
 
                 for m in self._MODRES_SNO_RE.finditer(modres_field):
                     position = m.group(1)
                     evidence = m.group(2) or ""
                     key = (acc, position)
-                    if key in self._seen_keys:
+                    if key in seen:
                         continue
-                    self._seen_keys.add(key)
+                    seen.add(key)
 
-                    pmids = self._extract_pmids(evidence)
+                    # Evidence strings repeat across sites; scan each once
+                    pmids = evidence_pmids.get(evidence)
+                    if pmids is None:
+                        pmids = evidence_pmids[evidence] = (
+                            self._extract_pmids(evidence))
 
-                    self.sites.append({
-                        "acc": acc,
-                        "gene": gene,
-                        "position": position,
-                        "organism": organism,
-                        "pmids": pmids,
-                        "evidence": evidence,
-                        "source_file": fpath.name,
-                    })
+                    yield acc, gene, position, organism, pmids, evidence
 
     @staticmethod
     def _extract_pmids(evidence_str):
         """Pull PubMed IDs from evidence strings."""
         if not evidence_str:
             return ""
-        pmids = re.findall(r'PubMed:(\d+)', evidence_str)
+        pmids = DbSNOAdapter._PUBMED_RE.findall(evidence_str)
         return ";".join(sorted(set(pmids)))
 
     # ------------------------------------------------------------------
@@ -233,20 +248,25 @@ class DbSNOAdapter:
     def get_edges(self):
         logger.info("dbSNO: Generating ProteinHasPTM edges (S-nitrosylation)...")
         count = 0
-        for site in self.sites:
-            edge_id = f"dbsno:{site['acc']}_C{site['position']}"
-            target = site["gene"] if site["gene"] else site["acc"]
+        proteins = set()
+        for acc, gene, position, organism, pmids, evidence in self._iter_sites():
+            proteins.add(acc)
+            edge_id = f"dbsno:{acc}_C{position}"
+            target = gene if gene else acc
             props = {
-                "site": self._sanitize(site["position"]),
+                "site": self._sanitize(position),
                 "ptm_type": "s-nitrosylation",
                 "residue": "Cys",
                 "score": 0,
                 "enzymes": "",
-                "pmids": self._sanitize(site["pmids"]),
+                "pmids": self._sanitize(pmids),
                 "source": "dbSNO",
-                "organism": self._sanitize(site["organism"]),
-                "evidence": self._sanitize(site["evidence"]),
+                "organism": self._sanitize(organism),
+                "evidence": self._sanitize(evidence),
             }
-            yield (None, site["acc"], target, "ProteinHasPTM", props)
+            yield (None, acc, target, "ProteinHasPTM", props)
             count += 1
-        logger.info(f"dbSNO: Generated {count} ProteinHasPTM edges")
+        logger.info(
+            f"dbSNO: Generated {count} ProteinHasPTM edges "
+            f"from {len(proteins)} proteins"
+        )
@@ -38,26 +38,39 @@ class DegronopediaAdapter:
         count = 0
 
         with open(path, 'r', encoding='utf-8') as f:
-            reader = csv.DictReader(f, delimiter='\t')
+            reader = csv.reader(f, delimiter='\t')
+            header = next(reader, [])
+            # Resolve column positions once. Missing columns point one past
+            # the header, at the '' slot every row is padded with below.
+            width = len(header)
+            col = {name: i for i, name in enumerate(header)}
+            i_org = col.get('Organism', width)
+            i_degron = col.get('Degron', width)
+            i_regex = col.get('Degron_regex', width)
+            i_location = col.get('Degron_location', width)
+            i_type = col.get('Degron_type', width)
+            i_ups = col.get('Known_UPS_components_recognizing_degron', width)
+
             for row in reader:
-                degron = row.get('Degron', '').strip()
-                regex = row.get('Degron_regex', '').strip()
-                organism = row.get('Organism', '').strip()
-                location = row.get('Degron_location', '').strip()
-                degron_type = row.get('Degron_type', '').strip()
-                ups_components = row.get('Known_UPS_components_recognizing_degron', '').strip()
+                if not row:
+                    continue
+                if len(row) < width:
+                    row.extend([''] * (width - len(row)))
+                row[width:] = ['']
 
-                if not degron:
+                # Most rows are non-human; reject them before reading the rest
+                if 'sapiens' not in row[i_org]:
                     continue
-                if 'sapiens' not in organism:
+                degron = row[i_degron].strip()
+                if not degron:
                     continue
 
                 self.degrons.append({
                     'degron': degron,
-                    'regex': regex,
-                    'location': location,
-                    'degron_type': degron_type,
-                    'ups_components': ups_components,
+                    'regex': row[i_regex].strip(),
+                    'location': row[i_location].strip(),
+                    'degron_type': row[i_type].strip(),
+                    'ups_components': row[i_ups].strip(),
                 })
                 count += 1
 
@@ -9,14 +9,32 @@ elements, satellites, and other repeat families.
 """
 
 import csv
+import sys
+from array import array
 from pathlib import Path
 from biocypher._logger import logger
 
+# Dfam TSV columns read by the adapter, in unpacking order
+_COLUMNS = (
+    'accession', 'name', 'title', 'length', 'repeat_type', 'repeat_subtype',
+    'classification',
+)
+
 
 class DfamAdapter:
     def __init__(self, data_dir="template_package/data/dfam"):
         self.data_dir = Path(data_dir)
-        self.families = []
+        # Column-wise storage (one list per field) instead of a dict per
+        # family; consensus lengths live in a compact int64 array
+        self.families = {
+            'accession': [],
+            'name': [],
+            'title': [],
+            'length': array('q'),
+            'repeat_type': [],
+            'repeat_subtype': [],
+            'classification': [],
+        }
         self._load_data()
 
     def _sanitize(self, text):
@@ -36,30 +54,52 @@ class DfamAdapter:
 
         logger.info("Dfam: Loading transposable element families...")
         count = 0
+        cols = self.families
+        classifications = {}  # raw -> sanitised, interned classification
+
+        with open(path, 'r', encoding='utf-8', buffering=1 << 20) as f:
+            reader = csv.reader(f, delimiter='\t')
+            header = next(reader, [])
+            # Resolve column positions once instead of building a dict per
+            # row. Missing columns point one past the header, at the ''
+            # slot every row is padded with below.
+            width = len(header)
+            col = {name: i for i, name in enumerate(header)}
+            (i_accession, i_name, i_title, i_length, i_repeat_type,
+             i_repeat_subtype, i_classification) = (
+                col.get(name, width) for name in _COLUMNS)
 
-        with open(path, 'r', encoding='utf-8') as f:
-            reader = csv.DictReader(f, delimiter='\t')
             for row in reader:
-                accession = row.get('accession', '').strip()
-                name = row.get('name', '').strip()
-                title = row.get('title', '').strip()
-                length = row.get('length', '0').strip()
-                repeat_type = row.get('repeat_type', '').strip()
-                repeat_subtype = row.get('repeat_subtype', '').strip()
-                classification = row.get('classification', '').strip()
+                if len(row) < width:
+                    row.extend([''] * (width - len(row)))
+                row[width:] = ['']
 
+                accession = row[i_accession].strip()
                 if not accession:
                     continue
 
-                self.families.append({
-                    'accession': accession,
-                    'name': name,
-                    'title': title,
-                    'length': int(length) if length.isdigit() else 0,
-                    'repeat_type': repeat_type,
-                    'repeat_subtype': repeat_subtype,
-                    'classification': classification,
-                })
+                name = row[i_name].strip()
+                title = row[i_title].strip()
+                length = row[i_length].strip()
+                repeat_type = row[i_repeat_type].strip()
+                repeat_subtype = row[i_repeat_subtype].strip()
+                classification = row[i_classification].strip()
+
+                # A few dozen classifications cover all families: sanitise
+                # and intern each distinct one once
+                classification_clean = classifications.get(classification)
+                if classification_clean is None:
+                    classification_clean = classifications[classification] = (
+                        sys.intern(self._sanitize(classification)))
+
+                # String columns hold final, sanitised property values
+                cols['accession'].append(accession)
+                cols['name'].append(self._sanitize(name))
+                cols['title'].append(self._sanitize(title))
+                cols['length'].append(int(length) if length.isdigit() else 0)
+                cols['repeat_type'].append(sys.intern(repeat_type))
+                cols['repeat_subtype'].append(sys.intern(repeat_subtype))
+                cols['classification'].append(classification_clean)
                 count += 1
 
         logger.info(f"Dfam: Loaded {count} TE families")
@@ -72,18 +112,25 @@ class DfamAdapter:
         logger.info("Dfam: Generating nodes...")
         count = 0
 
-        for fam in self.families:
+        cols = self.families
+        rows = zip(
+            cols['accession'], cols['name'], cols['title'], cols['length'],
+            cols['repeat_type'], cols['repeat_subtype'], cols['classification'],
+        )
+        for (accession, name, title, length, repeat_type, repeat_subtype,
+             classification) in rows:
+            # String columns were sanitised at load time
             props = {
-                'name': self._sanitize(fam['name']),
-                'title': self._sanitize(fam['title']),
-                'consensus_length': fam['length'],
-                'repeat_type': fam['repeat_type'],
-                'repeat_subtype': fam['repeat_subtype'],
-                'classification': self._sanitize(fam['classification']),
+                'name': name,
+                'title': title,
+                'consensus_length': length,
+                'repeat_type': repeat_type,
+                'repeat_subtype': repeat_subtype,
+                'classification': classification,
                 'source': 'Dfam',
             }
 
-            yield (fam['accession'], "TransposableElementFamily", props)
+            yield (accession, "TransposableElementFamily", props)
             count += 1
 
         logger.info(f"Dfam: Generated {count} TransposableElementFamily nodes")
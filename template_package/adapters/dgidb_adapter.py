@@ -7,15 +7,31 @@ Loads DGIdb drug-gene interaction data from GraphQL JSON exports and generates:
 """
 
 import json
+import sys
 from pathlib import Path
 from biocypher._logger import logger
 
+# ijson parses the dump incrementally; without it the whole file is loaded,
+# through orjson when available
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 class DGIdbAdapter:
     def __init__(self, data_dir="template_package/data/dgidb"):
         self.data_dir = Path(data_dir)
+        self.interactions_path = None
         self.drugs = {}           # concept_id -> {name, approved}
-        self.interactions = []    # [{drug_id, gene_name, score, types, sources}]
+        # Edge fields per interaction, cached only when the dump cannot be
+        # streamed; None means get_edges re-reads it with ijson
+        self.interactions = None
         self._load_data()
 
     def _sanitize(self, text):
@@ -27,67 +43,113 @@ class DGIdbAdapter:
         return text.strip()
 
     def _load_data(self):
-        """Load DGIdb JSON files."""
+        """
+        Load DGIdb drugs in a single pass over the interactions dump.
+
+        Without ijson the whole dump has to be decoded at once, so the same
+        pass also keeps the interaction edge fields. With ijson only the
+        drugs are kept and get_edges streams the dump again.
+        """
         interactions_path = self.data_dir / 'interactions.json'
         if not interactions_path.exists():
             logger.warning("DGIdb: interactions.json not found")
             return
 
         logger.info("DGIdb: Loading drug-gene interactions...")
+        self.interactions_path = interactions_path
+        interactions = [] if ijson is None else None
+        cleaned = {}
+
+        for node_id, drug, gene_name, inter in self._iter_interactions():
+            # The first interaction of a drug provides its properties
+            if node_id not in self.drugs:
+                self.drugs[node_id] = {
+                    'name': self._sanitize(drug['name']),
+                    'approved': drug.get('approved', False),
+                }
+            if interactions is not None:
+                interactions.append(
+                    self._edge_fields(node_id, gene_name, inter, cleaned))
+
+        self.interactions = interactions
+        if interactions is None:
+            logger.info(f"DGIdb: Loaded {len(self.drugs)} drugs")
+        else:
+            logger.info(
+                f"DGIdb: Loaded {len(self.drugs)} drugs, "
+                f"{len(interactions)} interactions"
+            )
+
+    def _iter_interactions(self):
+        """
+        Parse the interactions dump, yielding (node_id, drug, gene_name,
+        interaction) for every interaction with a named gene and drug.
+        """
+        if self.interactions_path is None:
+            return
 
-        with open(interactions_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        with open(self.interactions_path, 'rb') as f:
+            if ijson is not None:
+                # Stream one gene object at a time instead of building the
+                # whole GraphQL dump in memory
+                genes = ijson.items(f, 'data.genes.nodes.item', use_float=True)
+            else:
+                if orjson is not None:
+                    data = orjson.loads(f.read())
+                else:
+                    data = json.load(f)
+                genes = data.get('data', {}).get('genes', {}).get('nodes', [])
 
-        genes = data.get('data', {}).get('genes', {}).get('nodes', [])
+            for gene in genes:
+                gene_name = gene.get('name', '')
+                if not gene_name:
+                    continue
 
-        for gene in genes:
-            gene_name = gene.get('name', '')
-            if not gene_name:
-                continue
+                for inter in gene.get('interactions', []):
+                    drug = inter.get('drug', {})
+                    drug_name = drug.get('name', '')
+                    if not drug_name:
+                        continue
 
-            for inter in gene.get('interactions', []):
-                drug = inter.get('drug', {})
-                drug_name = drug.get('name', '')
-                drug_id = drug.get('conceptId', '')
-                approved = drug.get('approved', False)
+                    # Use concept ID as primary ID, fall back to name
+                    drug_id = drug.get('conceptId', '')
+                    if drug_id:
+                        node_id = drug_id
+                    else:
+                        node_id = f"DGIDB:{drug_name}"
 
-                if not drug_name:
-                    continue
+                    yield node_id, drug, gene_name, inter
 
-                # Use concept ID as primary ID, fall back to name
-                if drug_id:
-                    node_id = drug_id
-                else:
-                    node_id = f"DGIDB:{drug_name}"
-
-                # Register drug
-                if node_id not in self.drugs:
-                    self.drugs[node_id] = {
-                        'name': drug_name,
-                        'approved': approved,
-                    }
-
-                # Extract interaction metadata
-                score = inter.get('interactionScore', 0.0)
-                types = inter.get('interactionTypes', [])
-                type_str = '|'.join(t.get('type', '') for t in types if t.get('type'))
-                directionality = ''
-                if types:
-                    directionality = types[0].get('directionality', '')
-
-                sources = inter.get('sources', [])
-                source_str = '|'.join(s.get('fullName', '') for s in sources if s.get('fullName'))
-
-                self.interactions.append({
-                    'drug_id': node_id,
-                    'gene_name': gene_name,
-                    'score': score,
-                    'interaction_types': type_str,
-                    'directionality': directionality,
-                    'sources': source_str,
-                })
-
-        logger.info(f"DGIdb: Loaded {len(self.drugs)} drugs, {len(self.interactions)} interactions")
+    def _edge_fields(self, drug_id, gene_name, inter, cleaned):
+        """
+        Build the (drug_id, gene_name, score, types, directionality,
+        sources) edge fields of one interaction. cleaned memoises the
+        sanitised type and source summaries, of which only a few hundred
+        distinct ones occur.
+        """
+        score = inter.get('interactionScore', 0.0)
+        types = inter.get('interactionTypes', [])
+        type_str = '|'.join(t.get('type', '') for t in types if t.get('type'))
+        directionality = ''
+        if types:
+            directionality = types[0].get('directionality', '')
+
+        sources = inter.get('sources', [])
+        source_str = '|'.join(s.get('fullName', '') for s in sources if s.get('fullName'))
+
+        type_clean = cleaned.get(type_str)
+        if type_clean is None:
+            type_clean = cleaned[type_str] = sys.intern(
+                self._sanitize(type_str))
+        source_clean = cleaned.get(source_str)
+        if source_clean is None:
+            source_clean = cleaned[source_str] = sys.intern(
+                self._sanitize(source_str))
+
+        # Drug IDs repeat across many interactions: intern them so repeats
+        # share one object
+        return (sys.intern(drug_id), gene_name, score, type_clean,
+                directionality, source_clean)
 
     def get_nodes(self):
         """
@@ -99,8 +161,8 @@ class DGIdbAdapter:
 
         for drug_id, data in self.drugs.items():
             props = {
-                'name': self._sanitize(data['name']),
-                'approved': data.get('approved', False),
+                'name': data['name'],
+                'approved': data['approved'],
                 'source': 'DGIdb',
             }
 
@@ -117,18 +179,28 @@ class DGIdbAdapter:
         logger.info("DGIdb: Generating edges...")
         count = 0
 
-        for inter in self.interactions:
+        rows = self.interactions
+        if rows is None:
+            # Stream the dump again rather than holding every interaction
+            cleaned = {}
+            rows = (
+                self._edge_fields(node_id, gene_name, inter, cleaned)
+                for node_id, _, gene_name, inter in self._iter_interactions()
+            )
+
+        for drug_id, gene_name, score, types, directionality, sources in rows:
+            # Type and source summaries were sanitised in _edge_fields
             props = {
-                'interaction_score': inter['score'],
-                'interaction_types': self._sanitize(inter['interaction_types']),
-                'directionality': inter['directionality'],
-                'sources': self._sanitize(inter['sources']),
+                'interaction_score': score,
+                'interaction_types': types,
+                'directionality': directionality,
+                'sources': sources,
             }
 
             yield (
                 None,
-                inter['drug_id'],
-                inter['gene_name'],
+                drug_id,
+                gene_name,
                 "DrugGeneInteraction",
                 props
             )
@@ -15,12 +15,18 @@ import gzip
 from pathlib import Path
 from biocypher._logger import logger
 
+# DisGeNET TSV columns read by the adapter, in unpacking order
+_COLUMNS = (
+    'geneId', 'geneSymbol', 'diseaseId', 'diseaseName', 'diseaseType',
+    'diseaseClass', 'diseaseSemanticType', 'score', 'EI', 'YearInitial',
+    'YearFinal', 'NofPmids', 'NofSnps', 'DSI', 'DPI', 'source',
+)
+
 
 class DisGeNETAdapter:
     def __init__(self, data_dir="template_package/data/disgenet"):
         self.data_dir = Path(data_dir)
-        self.diseases = {}
-        self.associations = []
+        self.data_file = None  # (path, is_gzipped)
         self._load_data()
 
     def _sanitize(self, text):
@@ -100,10 +106,14 @@ class DisGeNETAdapter:
         """Open a file, handling gzip transparently."""
         if is_gzipped:
             return gzip.open(path, 'rt', encoding='utf-8')
-        return open(path, 'r', encoding='utf-8', errors='replace')
+        return open(path, 'r', encoding='utf-8', errors='replace',
+                    buffering=1 << 20)
 
     def _load_data(self):
-        """Load DisGeNET curated gene-disease associations."""
+        """
+        Locate the DisGeNET data file. It is parsed on demand in
+        get_nodes/get_edges, so no association data is held in memory.
+        """
         if not self.data_dir.exists():
             logger.warning("DisGeNET: data directory not found")
             return
@@ -115,94 +125,109 @@ class DisGeNETAdapter:
             )
             return
 
+        self.data_file = (path, is_gzipped)
         logger.info(
-            f"DisGeNET: Loading gene-disease associations from {path.name}..."
+            f"DisGeNET: Found gene-disease associations in {path.name}"
         )
-        count = 0
-        seen = set()
 
-        with self._open_file(path, is_gzipped) as f:
-            reader = csv.DictReader(f, delimiter='\t')
-
-            for row in reader:
-                gene_id = (row.get('geneId') or '').strip()
-                gene_symbol = (row.get('geneSymbol') or '').strip()
-                disease_id = (row.get('diseaseId') or '').strip()
-                disease_name = (row.get('diseaseName') or '').strip()
-                disease_type = (row.get('diseaseType') or '').strip()
-                disease_class = (row.get('diseaseClass') or '').strip()
-                disease_semantic_type = (
-                    row.get('diseaseSemanticType') or ''
-                ).strip()
-                score_str = (row.get('score') or '').strip()
-                ei_str = (row.get('EI') or '').strip()
-                year_initial = (row.get('YearInitial') or '').strip()
-                year_final = (row.get('YearFinal') or '').strip()
-                n_pmids = (row.get('NofPmids') or '').strip()
-                n_snps = (row.get('NofSnps') or '').strip()
-                dsi_str = (row.get('DSI') or '').strip()
-                dpi_str = (row.get('DPI') or '').strip()
-                source = (row.get('source') or '').strip()
+    def _read_header(self, reader):
+        """
+        Resolve the _COLUMNS positions from the header row of reader.
+        Missing columns point one past the header, at the '' slot every row
+        is padded with. Returns (width, indexes).
+        """
+        header = next(reader, [])
+        width = len(header)
+        col = {name: i for i, name in enumerate(header)}
+        return width, [col.get(name, width) for name in _COLUMNS]
 
-                if not gene_id or not disease_id:
-                    continue
+    def _iter_associations(self):
+        """
+        Parse the data file, yielding the edge fields of each unique
+        gene-disease pair, ready to use as property values.
+        """
+        if self.data_file is None:
+            return
+        path, is_gzipped = self.data_file
 
-                # Parse numeric fields
+        seen = set()
+        # Raw string -> sanitised value. Symbols and sources repeat heavily,
+        # so each distinct value is cleaned once. Years and DSI/DPI are
+        # numeric columns and only need stripping.
+        cleaned = {}
+
+        def clean(text):
+            value = cleaned.get(text)
+            if value is None:
+                value = cleaned[text] = self._sanitize(text)
+            return value
+
+        # Numeric columns also take few distinct values: convert each one
+        # once and skip the exception path on the blank or malformed ones
+        floats = {}
+        ints = {}
+
+        def to_float(text):
+            value = floats.get(text)
+            if value is None:
                 try:
-                    score = float(score_str)
+                    value = float(text)
                 except (ValueError, TypeError):
-                    score = 0.0
+                    value = 0.0
+                floats[text] = value
+            return value
 
+        def to_int(text):
+            value = ints.get(text)
+            if value is None:
                 try:
-                    ei = float(ei_str)
+                    value = int(text)
                 except (ValueError, TypeError):
-                    ei = 0.0
+                    value = 0
+                ints[text] = value
+            return value
 
-                try:
-                    pmid_count = int(n_pmids)
-                except (ValueError, TypeError):
-                    pmid_count = 0
+        with self._open_file(path, is_gzipped) as f:
+            reader = csv.reader(f, delimiter='\t')
+            # Resolve column positions once instead of building a dict per row
+            width, indexes = self._read_header(reader)
+            (i_gene_id, i_gene_symbol, i_disease_id, _, _, _, _, i_score,
+             i_ei, i_year_initial, i_year_final, i_pmids, i_snps, i_dsi,
+             i_dpi, i_source) = indexes
 
-                try:
-                    snp_count = int(n_snps)
-                except (ValueError, TypeError):
-                    snp_count = 0
+            for row in reader:
+                if len(row) < width:
+                    row.extend([''] * (width - len(row)))
+                row[width:] = ['']
 
-                # Deduplicate by gene-disease pair
+                gene_id = row[i_gene_id].strip()
+                disease_id = row[i_disease_id].strip()
+                if not gene_id or not disease_id:
+                    continue
+
+                # Deduplicate by gene-disease pair before parsing the rest
                 key = (gene_id, disease_id)
                 if key in seen:
                     continue
                 seen.add(key)
 
-                # Register disease node
-                if disease_id not in self.diseases:
-                    self.diseases[disease_id] = {
-                        'name': disease_name,
-                        'type': disease_type,
-                        'disease_class': disease_class,
-                        'semantic_type': disease_semantic_type,
-                    }
-
-                self.associations.append({
-                    'gene_id': gene_id,
-                    'gene_symbol': gene_symbol,
-                    'disease_id': disease_id,
-                    'score': score,
-                    'ei': ei,
-                    'year_initial': year_initial,
-                    'year_final': year_final,
-                    'pmid_count': pmid_count,
-                    'snp_count': snp_count,
-                    'dsi': dsi_str,
-                    'dpi': dpi_str,
-                    'source': source,
-                })
-                count += 1
-
-        logger.info(
-            f"DisGeNET: Loaded {count} gene-disease associations, "
-            f"{len(self.diseases)} diseases"
-        )
+                gene_symbol = row[i_gene_symbol].strip()
+                score_str = row[i_score].strip()
+                ei_str = row[i_ei].strip()
+                year_initial = row[i_year_initial].strip()
+                year_final = row[i_year_final].strip()
+                n_pmids = row[i_pmids].strip()
+                n_snps = row[i_snps].strip()
+                dsi_str = row[i_dsi].strip()
+                dpi_str = row[i_dpi].strip()
+                source = row[i_source].strip()
+
+                yield (
+                    gene_id, disease_id, clean(gene_symbol),
+                    to_float(score_str), to_float(ei_str), year_initial,
+                    year_final, to_int(n_pmids), to_int(n_snps), dsi_str,
+                    dpi_str, clean(source),
+                )
 
     def get_nodes(self):
         """
@@ -211,22 +236,59 @@ class DisGeNETAdapter:
         """
         logger.info("DisGeNET: Generating Disease nodes...")
         count = 0
+        if self.data_file is None:
+            return
+        path, is_gzipped = self.data_file
+        seen = set()
+        # Raw disease type/class/semantic type -> sanitised value. A few
+        # dozen MeSH class strings cover most diseases, so each distinct
+        # value is truncated and cleaned once.
+        classes = {}
+        cleaned = {}
+
+        def clean(text):
+            value = cleaned.get(text)
+            if value is None:
+                value = cleaned[text] = self._sanitize(text)
+            return value
 
-        for disease_id, data in self.diseases.items():
-            props = {
-                'name': self._sanitize(data['name']),
-                'disease_type': self._sanitize(data['type']),
-                'disease_class': self._sanitize(
-                    data['disease_class'][:300]
-                    if data['disease_class']
-                    else ''
-                ),
-                'semantic_type': self._sanitize(data['semantic_type']),
-                'source': 'DisGeNET',
-            }
+        with self._open_file(path, is_gzipped) as f:
+            reader = csv.reader(f, delimiter='\t')
+            width, indexes = self._read_header(reader)
+            (i_gene_id, _, i_disease_id, i_disease_name, i_disease_type,
+             i_disease_class, i_semantic_type) = indexes[:7]
 
-            yield (disease_id, "Disease", props)
-            count += 1
+            for row in reader:
+                if len(row) < width:
+                    row.extend([''] * (width - len(row)))
+                row[width:] = ['']
+
+                # The first association of a disease provides its
+                # properties; only the disease columns are read
+                disease_id = row[i_disease_id].strip()
+                if not disease_id or disease_id in seen:
+                    continue
+                if not row[i_gene_id].strip():
+                    continue
+                seen.add(disease_id)
+
+                raw_class = row[i_disease_class]
+                disease_class = classes.get(raw_class)
+                if disease_class is None:
+                    disease_class = raw_class.strip()
+                    disease_class = classes[raw_class] = self._sanitize(
+                        disease_class[:300] if disease_class else '')
+
+                props = {
+                    'name': self._sanitize(row[i_disease_name]),
+                    'disease_type': clean(row[i_disease_type]),
+                    'disease_class': disease_class,
+                    'semantic_type': clean(row[i_semantic_type]),
+                    'source': 'DisGeNET',
+                }
+
+                yield (disease_id, "Disease", props)
+                count += 1
 
         logger.info(f"DisGeNET: Generated {count} Disease nodes")
 
@@ -238,22 +300,25 @@ class DisGeNETAdapter:
         logger.info("DisGeNET: Generating edges...")
         count = 0
 
-        for assoc in self.associations:
+        for (gene_id, disease_id, gene_symbol, score, ei, year_initial,
+             year_final, pmid_count, snp_count, dsi, dpi,
+             source) in self._iter_associations():
             # Source is NCBI gene ID, target is disease ID (UMLS CUI)
-            source_id = f"ncbigene:{assoc['gene_id']}"
-            target_id = assoc['disease_id']
+            source_id = f"ncbigene:{gene_id}"
+            target_id = disease_id
 
+            # String properties were sanitised while parsing
             props = {
-                'gene_symbol': self._sanitize(assoc['gene_symbol']),
-                'score': assoc['score'],
-                'ei': assoc['ei'],
-                'year_initial': self._sanitize(assoc['year_initial']),
-                'year_final': self._sanitize(assoc['year_final']),
-                'pmid_count': assoc['pmid_count'],
-                'snp_count': assoc['snp_count'],
-                'dsi': self._sanitize(assoc['dsi']),
-                'dpi': self._sanitize(assoc['dpi']),
-                'disgenet_source': self._sanitize(assoc['source']),
+                'gene_symbol': gene_symbol,
+                'score': score,
+                'ei': ei,
+                'year_initial': year_initial,
+                'year_final': year_final,
+                'pmid_count': pmid_count,
+                'snp_count': snp_count,
+                'dsi': dsi,
+                'dpi': dpi,
+                'disgenet_source': source,
                 'source': 'DisGeNET',
             }
 
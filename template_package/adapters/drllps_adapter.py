@@ -15,7 +15,7 @@ from biocypher._logger import logger
 class DrLLPSAdapter:
     def __init__(self, data_dir="template_package/data/drllps"):
         self.data_dir = Path(data_dir)
-        self.proteins = []
+        self.data_path = None
         self._load_data()
 
     def _sanitize(self, text):
@@ -27,51 +27,52 @@ class DrLLPSAdapter:
         return text.strip()
 
     def _load_data(self):
-        """Load DrLLPS LLPS protein data."""
+        """
+        Locate the DrLLPS data file. It is parsed on demand in get_edges,
+        so no protein data is held in memory.
+        """
         path = self.data_dir / 'drllps_all.txt'
         if not path.exists():
             logger.warning("DrLLPS: data file not found")
             return
 
-        logger.info("DrLLPS: Loading LLPS protein data...")
-        count = 0
+        self.data_path = path
+        logger.info("DrLLPS: Found LLPS protein data")
+
+    def _iter_proteins(self):
+        """
+        Parse the data file, yielding (uniprot, gene_name, ensembl,
+        condensate, llps_type) for the first human row of each protein.
+        """
+        if self.data_path is None:
+            return
+        seen = set()
 
-        with open(path, 'r', encoding='utf-8') as f:
-            header = None
+        with open(self.data_path, 'r', encoding='utf-8') as f:
+            f.readline()  # header
             for line in f:
                 parts = line.strip().split('\t')
-                if header is None:
-                    header = parts
-                    continue
-
                 if len(parts) < 7:
                     continue
 
-                drllps_id = parts[0].strip()
-                uniprot = parts[1].strip()
-                gene_name = parts[2].strip()
-                ensembl = parts[3].strip()
-                species = parts[4].strip()
-                condensate = parts[5].strip()
-                llps_type = parts[6].strip()
-
-                if species != 'Homo sapiens':
+                # Most rows are other species; reject them before stripping
+                # the remaining fields
+                if parts[4].strip() != 'Homo sapiens':
                     continue
 
-                if not uniprot:
+                uniprot = parts[1].strip()
+                # One edge per protein; the first row for it wins
+                if not uniprot or uniprot in seen:
                     continue
+                seen.add(uniprot)
 
-                self.proteins.append({
-                    'drllps_id': drllps_id,
-                    'uniprot': uniprot,
-                    'gene_name': gene_name,
-                    'ensembl': ensembl,
-                    'condensate': condensate,
-                    'llps_type': llps_type,
-                })
-                count += 1
-
-        logger.info(f"DrLLPS: Loaded {count} human LLPS proteins")
+                yield (
+                    uniprot,
+                    parts[2].strip(),
+                    parts[3].strip(),
+                    parts[5].strip(),
+                    parts[6].strip(),
+                )
 
     def get_nodes(self):
         """No new nodes."""
@@ -84,25 +85,20 @@ class DrLLPSAdapter:
         Yields: (id, source, target, label, properties)
         """
         logger.info("DrLLPS: Generating edges...")
-        seen = set()
         count = 0
 
-        for prot in self.proteins:
-            if prot['uniprot'] in seen:
-                continue
-            seen.add(prot['uniprot'])
-
+        for uniprot, gene_name, ensembl, condensate, llps_type in self._iter_proteins():
             props = {
-                'gene_name': self._sanitize(prot['gene_name']),
-                'condensate': self._sanitize(prot['condensate']),
-                'llps_type': prot['llps_type'],
-                'ensembl_id': prot['ensembl'],
+                'gene_name': self._sanitize(gene_name),
+                'condensate': self._sanitize(condensate),
+                'llps_type': llps_type,
+                'ensembl_id': ensembl,
                 'source': 'DrLLPS',
             }
 
             yield (
                 None,
-                prot['uniprot'],
+                uniprot,
                 "LLPS",
                 "LLPSProtein",
                 props
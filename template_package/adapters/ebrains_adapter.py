@@ -7,6 +7,11 @@ import json
 from pathlib import Path
 from biocypher._logger import logger
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 class EBRAINSAdapter:
     def __init__(self, data_dir="template_package/data/ebrains"):
@@ -28,8 +33,11 @@ class EBRAINSAdapter:
             return
         for fpath in self.data_dir.glob("*.json"):
             try:
-                with open(fpath, 'r') as f:
-                    data = json.load(f)
+                with open(fpath, 'rb') as f:
+                    if orjson is not None:
+                        data = orjson.loads(f.read())
+                    else:
+                        data = json.load(f)
                 if isinstance(data, list):
                     self.entries.extend(data)
                 elif isinstance(data, dict) and 'results' in data:
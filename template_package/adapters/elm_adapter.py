@@ -8,22 +8,37 @@ Loads ELM motif classes and instances, generating:
 
 import csv
 import re
+from operator import itemgetter
 from pathlib import Path
 from biocypher._logger import logger
 
+# HTML tags embedded in ELM descriptions and names
+_HTML_TAG_RE = re.compile(r'<[^>]+>')
+
+# Columns read from each ELM download, in unpacking order
+_CLASS_COLUMNS = (
+    'Accession', 'ELMIdentifier', 'FunctionalSiteName', 'Description',
+    'Regex', 'Probability', '#Instances', '#Instances_in_PDB',
+)
+_INSTANCE_COLUMNS = (
+    'Primary_Acc', 'ELMIdentifier', 'Accession', 'Organism', 'Start', 'End',
+    'InstanceLogic', 'Methods',
+)
+
 
 class ELMAdapter:
     def __init__(self, data_dir="template_package/data/elm"):
         self.data_dir = Path(data_dir)
-        self.classes = []
-        self.instances = []
+        self.classes = []    # tuples of _CLASS_COLUMNS values
+        self.instances = []  # tuples of _INSTANCE_COLUMNS values
         self._load_data()
 
     def _sanitize(self, text):
         if text is None:
             return ""
         text = str(text)
-        text = re.sub(r'<[^>]+>', '', text)
+        if '<' in text:
+            text = _HTML_TAG_RE.sub('', text)
         text = text.replace('"', '""')
         text = text.replace('\n', ' ').replace('\r', ' ').replace('\t', ' ')
         return text.strip()
@@ -33,50 +48,67 @@ class ELMAdapter:
         # Load ELM classes (motif definitions)
         classes_path = self.data_dir / 'elms.tsv'
         if classes_path.exists():
-            self._load_tsv(classes_path, self.classes, 'classes')
+            self._load_tsv(classes_path, self.classes, _CLASS_COLUMNS, 'classes')
 
         # Fallback: try elm_classes.tsv if elms.tsv was HTML
         if not self.classes:
             classes_path2 = self.data_dir / 'elm_classes.tsv'
             if classes_path2.exists():
-                self._load_tsv(classes_path2, self.classes, 'classes')
+                self._load_tsv(classes_path2, self.classes, _CLASS_COLUMNS,
+                               'classes')
 
         # Load ELM instances
         instances_path = self.data_dir / 'elm_instances.tsv'
         if instances_path.exists():
-            self._load_tsv(instances_path, self.instances, 'instances')
+            self._load_tsv(instances_path, self.instances, _INSTANCE_COLUMNS,
+                           'instances')
 
         logger.info(f"ELM: Loaded {len(self.classes)} motif classes, {len(self.instances)} instances")
 
-    def _load_tsv(self, path, target_list, data_type):
-        """Load a TSV file, skipping comment lines."""
+    def _load_tsv(self, path, target_list, columns, data_type):
+        """
+        Load a TSV file, skipping comment lines. Each row is stored as a
+        tuple of the given columns, with '' for columns the file lacks.
+        """
         try:
             with open(path, 'r', encoding='utf-8') as f:
-                # Skip comment lines
+                # Skip blank and comment lines; the first line kept is the
+                # header
                 lines = []
-                header = None
                 for line in f:
                     line = line.strip()
-                    if line.startswith('#'):
-                        continue
-                    if not line:
+                    if not line or line[0] == '#':
                         continue
                     # Check if this is HTML (failed download)
-                    if line.startswith('<!DOCTYPE') or line.startswith('<html'):
+                    if line[0] == '<' and (line.startswith('<!DOCTYPE')
+                                           or line.startswith('<html')):
                         logger.warning(f"ELM: {path.name} appears to be HTML, skipping")
                         return
-                    if header is None:
-                        header = line
-                        lines.append(header)
-                    else:
-                        lines.append(line)
+                    lines.append(line)
 
                 if not lines:
                     return
 
-                reader = csv.DictReader(lines, delimiter='\t', quotechar='"')
+                reader = csv.reader(lines, delimiter='\t', quotechar='"')
+                fieldnames = next(reader)
+                # Resolve column positions once instead of building a dict
+                # per row. A header that kept its quotes also matches the
+                # bare name; missing columns point one past the header, at
+                # the '' slot every row is padded with below.
+                width = len(fieldnames)
+                col = {}
+                for i, name in enumerate(fieldnames):
+                    if (len(name) > 1 and name[0] == name[-1] == '"'
+                            and name[1:-1] not in fieldnames):
+                        name = name[1:-1]
+                    col[name] = i
+                pick = itemgetter(*(col.get(name, width) for name in columns))
+
                 for row in reader:
-                    target_list.append(row)
+                    if len(row) < width:
+                        row.extend([''] * (width - len(row)))
+                    row[width:] = ['']
+                    target_list.append(pick(row))
 
                 logger.info(f"ELM: Loaded {len(target_list)} {data_type} from {path.name}")
         except Exception as e:
@@ -90,16 +122,8 @@ class ELMAdapter:
         logger.info("ELM: Generating nodes...")
         count = 0
 
-        for cls in self.classes:
-            acc = cls.get('Accession', cls.get('"Accession"', ''))
-            elm_id = cls.get('ELMIdentifier', cls.get('"ELMIdentifier"', ''))
-            func_name = cls.get('FunctionalSiteName', cls.get('"FunctionalSiteName"', ''))
-            description = cls.get('Description', cls.get('"Description"', ''))
-            regex = cls.get('Regex', cls.get('"Regex"', ''))
-            probability = cls.get('Probability', cls.get('"Probability"', ''))
-            num_instances = cls.get('#Instances', cls.get('"#Instances"', ''))
-            num_pdb = cls.get('#Instances_in_PDB', cls.get('"#Instances_in_PDB"', ''))
-
+        for (acc, elm_id, func_name, description, regex, probability,
+             num_instances, num_pdb) in self.classes:
             if not acc:
                 continue
 
@@ -137,16 +161,13 @@ class ELMAdapter:
         logger.info("ELM: Generating edges...")
         count = 0
 
-        for inst in self.instances:
-            primary_acc = inst.get('Primary_Acc', inst.get('"Primary_Acc"', ''))
-            elm_identifier = inst.get('ELMIdentifier', inst.get('"ELMIdentifier"', ''))
-            elm_acc = inst.get('Accession', inst.get('"Accession"', ''))
-            organism = inst.get('Organism', inst.get('"Organism"', ''))
-            start = inst.get('Start', inst.get('"Start"', ''))
-            end = inst.get('End', inst.get('"End"', ''))
-            logic = inst.get('InstanceLogic', inst.get('"InstanceLogic"', ''))
-            methods = inst.get('Methods', inst.get('"Methods"', ''))
+        # ELM identifier -> class accession; the first class listed wins
+        class_accessions = {}
+        for acc, elm_id, *_ in self.classes:
+            class_accessions.setdefault(elm_id, acc)
 
+        for (primary_acc, elm_identifier, elm_acc, organism, start, end,
+             logic, methods) in self.instances:
             if not primary_acc or not elm_identifier:
                 continue
 
@@ -156,13 +177,7 @@ class ELMAdapter:
                 continue
 
             # Find the class accession for this identifier
-            class_acc = None
-            for cls in self.classes:
-                cls_id = cls.get('ELMIdentifier', cls.get('"ELMIdentifier"', ''))
-                cls_acc = cls.get('Accession', cls.get('"Accession"', ''))
-                if cls_id == elm_identifier:
-                    class_acc = cls_acc
-                    break
+            class_acc = class_accessions.get(elm_identifier)
 
             target_id = f"ELM:{class_acc}" if class_acc else f"ELM:{elm_identifier}"
 